@@ -0,0 +1,51 @@
+import os
+
+import pygame
+
+# Base directory of the script
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SOUNDS_DIR = os.path.join(BASE_DIR, '..', 'assets', 'sounds')
+
+# 512 Samples bei 44,1 kHz = 11,6 ms Puffer, weniger als ein Frame (16,7 ms)
+MIXER_SETTINGS = dict(frequency=44100, size=-16, channels=2, buffer=512)
+
+# Ereignis aus Game.on_sound -> (Datei, Lautstärke). Münze ('coin'), Uhren
+# ('clock', 'clock2') und Tod ('death') melden sich ebenfalls; sie bleiben
+# stumm, bis hier eine Datei eingetragen ist.
+SOUND_FILES = {
+    'jump': ('sprung.wav', 1.0),
+}
+
+
+def pre_init():
+    """Mixer-Einstellungen festlegen; muss vor pygame.init() laufen"""
+    pygame.mixer.pre_init(**MIXER_SETTINGS)
+
+
+class Audio:
+    """Soundeffekte, einmal dekodiert, jeder auf einem reservierten Kanal
+
+    play(name) kostet nur einen Dict-Zugriff und Channel.play(): kein Laden,
+    keine Kanalsuche und keine neuen Objekte pro Aufruf. Ein Kanal pro
+    Effekt heißt, dass ein neuer Sprung den noch klingenden abschneidet,
+    statt andere Effekte zu verdrängen. Ohne Audiogerät oder mit
+    SDL_AUDIODRIVER=dummy (headless, Benchmarks) ist play() wirkungslos.
+    """
+
+    def __init__(self):
+        self.channels = {}  # Ereignis -> (Kanal, Sound)
+        self.enabled = os.environ.get('SDL_AUDIODRIVER') != 'dummy' and pygame.mixer.get_init() is not None
+        if not self.enabled:
+            return
+
+        pygame.mixer.set_reserved(len(SOUND_FILES))
+        for number, (name, (path, volume)) in enumerate(SOUND_FILES.items()):
+            sound = pygame.mixer.Sound(os.path.join(SOUNDS_DIR, path))
+            sound.set_volume(volume)
+            self.channels[name] = (pygame.mixer.Channel(number), sound)
+
+    def play(self, name):
+        entry = self.channels.get(name)
+        if entry is not None:
+            channel, sound = entry
+            channel.play(sound)
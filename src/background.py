@@ -0,0 +1,55 @@
+import math
+
+import pygame
+
+# Sichtbare Höhe der braunen Ränder unter dem Boden und über der Decke
+BAND_HEIGHT = 10
+
+
+def render_strip(tile, width, band_color, band_above):
+    """Kachelt tile einmal über width + eine Kachelbreite, mit farbigem Rand oben oder unten"""
+    tile_width, tile_height = tile.get_size()
+    strip = pygame.Surface((width + tile_width, tile_height + BAND_HEIGHT))
+    strip.fill(band_color)
+    tile_y = BAND_HEIGHT if band_above else 0
+    for x in range(0, strip.get_width(), tile_width):
+        strip.blit(tile, (x, tile_y))
+    if pygame.display.get_surface() is not None:
+        strip = strip.convert()
+    return strip
+
+
+class ScrollingBackground:
+    """Boden und Decke als vorgerenderte Streifen, pro Frame je ein Blit
+
+    Die Streifen sind eine Kachel breiter als der Bildschirm; gescrollt wird
+    nur über den Ausschnitt (area) beim Blit. Der Offset bleibt ein float,
+    damit auch Bruchteile von game_speed über mehrere Frames ankommen.
+    """
+
+    def __init__(self, boden_image, decke_image, width, height, band_color):
+        self.width = width
+        self.tile_width = boden_image.get_width()
+        self.offset = 0.0
+
+        self.ground = render_strip(boden_image, width, band_color, band_above=False)
+        self.ceiling = render_strip(decke_image, width, band_color, band_above=True)
+        self.ground_y = height - BAND_HEIGHT - boden_image.get_height()
+        self.ceiling_y = 0
+
+    def scroll(self, distance):
+        """Um distance Pixel nach links weiterschieben"""
+        self.offset = (self.offset + distance) % self.tile_width
+
+    def draw(self, screen, lag=0.0):
+        """Boden und Decke inklusive brauner Ränder zeichnen; gibt die Rects zurück
+
+        lag zeichnet den Streifen so viele Pixel weiter rechts (Interpolation
+        zwischen zwei Simulationsschritten).
+        """
+        # Wie bei den früheren Einzelkacheln (Blit schneidet Positionen ab) wird aufgerundet
+        area_x = math.ceil((self.offset - lag) % self.tile_width)
+        return [
+            screen.blit(self.ground, (0, self.ground_y), (area_x, 0, self.width, self.ground.get_height())),
+            screen.blit(self.ceiling, (0, self.ceiling_y), (area_x, 0, self.width, self.ceiling.get_height())),
+        ]
@@ -0,0 +1,517 @@
+import sys
+import time
+
+import numpy as np
+
+from game import WIDTH, HEIGHT, FPS, FRAME_SPEEDUP, JUMP_SPEEDUP, SPIKE_PATTERNS, asset_sizes, enable_headless
+
+# Musternummern (Index in SPIKE_PATTERNS)
+SINGLE_TOP, SINGLE_BOTTOM, ALTERNATING, GAP_TOP, GAP_BOTTOM, DOUBLE_GAP, SAFE_ZONE = range(len(SPIKE_PATTERNS))
+NO_PATTERN = -1
+
+# Verfügbare Muster je Schwierigkeitsstufe, wie in Game.choose_spike_pattern
+BEGINNER_PATTERNS = [SINGLE_TOP, SINGLE_BOTTOM, SAFE_ZONE, GAP_TOP, GAP_BOTTOM]
+MEDIUM_PATTERNS = [SINGLE_TOP, SINGLE_BOTTOM, ALTERNATING, GAP_TOP, GAP_BOTTOM, DOUBLE_GAP]
+HARD_PATTERNS = list(range(len(SPIKE_PATTERNS)))
+RECOVERY_PATTERNS = [ALTERNATING, SAFE_ZONE, DOUBLE_GAP]
+
+# Seite der zuletzt gespawnten Spikes (für consecutive_same_position)
+SIDE_NONE, SIDE_TOP, SIDE_BOTTOM = 0, 1, 2
+
+
+def _pattern_table(*pattern_lists):
+    """Musterlisten als gepolsterte Tabelle plus Längen (für vektorisierte Auswahl)"""
+    width = max(len(patterns) for patterns in pattern_lists)
+    table = np.full((len(pattern_lists), width), NO_PATTERN, dtype=np.int8)
+    for row, patterns in enumerate(pattern_lists):
+        table[row, :len(patterns)] = patterns
+    counts = np.array([len(patterns) for patterns in pattern_lists])
+    return table, counts
+
+
+PATTERN_TABLE, PATTERN_COUNTS = _pattern_table(BEGINNER_PATTERNS, MEDIUM_PATTERNS, HARD_PATTERNS,
+                                               RECOVERY_PATTERNS)
+
+
+class BatchRunner:
+    """Simuliert N unabhängige Runden gleichzeitig als NumPy-Arrays
+
+    Jeder Aufruf von step(actions) rückt alle Runden um einen Frame vor. Die
+    Regeln entsprechen Game (Physik, Muster, Münze, Uhren, Kollision); nur der
+    Zufall kommt aus einem gemeinsamen numpy Generator, sodass einzelne
+    Runden nicht bitgenau mit Game übereinstimmen.
+    Spikes liegen in festen Slots (max_spikes pro Runde), freie Slots sind
+    über spike_alive markiert.
+    """
+
+    def __init__(self, n, seed=None, sizes=None, max_spikes=16, auto_reset=False):
+        sizes = sizes or asset_sizes()
+        self.n = n
+        self.max_spikes = max_spikes
+        self.auto_reset = auto_reset
+        self.rng = np.random.default_rng(seed)
+
+        self.player_size = sizes['player']
+        self.coin_size = sizes['coin']
+        self.uhr_size = sizes['uhr']
+        self.uhr2_size = sizes['uhr2']
+        self.spike_size = sizes['spike']
+        self.ground_y = HEIGHT - self.player_size[1] - 40
+        self.ceiling_y = 40
+        self.spike_top_y = 40
+        self.spike_bottom_y = HEIGHT - self.spike_size - 34
+
+        # Hitboxen wie in Game.check_spike_collision (pygame.Rect schneidet auf int ab)
+        self.player_x = 50
+        self.player_hit_x = int(self.player_x + self.player_size[0] * 0.1)
+        self.player_hit_w = int(self.player_size[0] * 0.8)
+        self.player_hit_dy = self.player_size[1] * 0.1
+        self.player_hit_h = int(self.player_size[1] * 0.8)
+        self.spike_hit_d = self.spike_size * 0.1
+        self.spike_hit_w = int(self.spike_size * 0.8)
+
+        def zeros(dtype=np.float64, shape=(n,)):
+            return np.zeros(shape, dtype=dtype)
+
+        # Spielfigur
+        self.player_y = zeros()
+        self.movement_speed = zeros()
+        self.is_moving_up = zeros(bool)
+        self.is_moving_down = zeros(bool)
+        self.destination_pos = zeros()
+        self.air_jump_used = zeros(bool)
+        self.game_speed = zeros()
+
+        # Physik (Uhren)
+        self.current_movement_speed = zeros()
+        self.current_acceleration = zeros()
+        self.pending_physics_reset = zeros(bool)
+
+        # Spikes
+        self.spike_x = zeros(shape=(n, max_spikes))
+        self.spike_y = zeros(shape=(n, max_spikes))
+        self.spike_alive = zeros(bool, (n, max_spikes))
+        self.spawn_timer_spike = zeros(np.int64)
+        self.spawn_interval_spike = zeros(np.int64)
+        self.current_pattern = zeros(np.int8)
+        self.pattern_progress = zeros(np.int64)
+        self.pattern_length = zeros(np.int64)
+        self.consecutive_same_position = zeros(np.int64)
+        self.last_side = zeros(np.int8)
+
+        # Münze
+        self.coin_x = zeros()
+        self.coin_y = zeros()
+        self.coin_alive = zeros(bool)
+        self.spawn_timer_coin = zeros(np.int64)
+        self.spawn_interval_coin = zeros(np.int64)
+
+        # Uhren
+        self.uhr_x = zeros()
+        self.uhr_y = zeros()
+        self.uhr_alive = zeros(bool)
+        self.uhr2_x = zeros()
+        self.uhr2_y = zeros()
+        self.uhr2_alive = zeros(bool)
+        self.spawn_timer_uhr = zeros(np.int64)
+        self.spawn_timer_uhr2 = zeros(np.int64)
+        self.spawn_interval_uhr = zeros(np.int64)
+        self.spawn_interval_uhr2 = zeros(np.int64)
+        self.clock_spawn_cooldown = zeros(np.int64)
+        self.clock_active = zeros(bool)
+        self.clock2_active = zeros(bool)
+        self.clock_timer = zeros()
+        self.clock2_timer = zeros()
+
+        # Punkte, Timer und Sprünge
+        self.frame = zeros(np.int64)
+        self.timer = zeros()
+        self.coins_collected = zeros(np.int64)
+        self.jumps = zeros(np.int64)
+        self.game_over = zeros(bool)
+        self.died = zeros(bool)  # In diesem Frame gestorben
+        self.score = zeros(np.int64)  # Score der zuletzt beendeten Runde
+
+        self.original_movement_speed = 0.6
+        self.original_acceleration = 7
+        self.clock_duration = 10.0
+
+        self.reset()
+
+    def reset(self, mask=None):
+        """Setzt alle (oder die per Maske gewählten) Runden auf Spielbeginn"""
+        if mask is None:
+            mask = np.ones(self.n, dtype=bool)
+        count = int(mask.sum())
+        if not count:
+            return
+
+        self.player_y[mask] = self.ground_y
+        self.movement_speed[mask] = 0.001
+        self.is_moving_up[mask] = False
+        self.is_moving_down[mask] = False
+        self.destination_pos[mask] = self.ground_y
+        self.air_jump_used[mask] = False
+        self.game_speed[mask] = 6.0
+
+        self.current_movement_speed[mask] = self.original_movement_speed
+        self.current_acceleration[mask] = self.original_acceleration
+        self.pending_physics_reset[mask] = False
+
+        self.spike_alive[mask] = False
+        self.spawn_timer_spike[mask] = 0
+        self.spawn_interval_spike[mask] = int(0.25 * FPS) * 3
+        self.current_pattern[mask] = NO_PATTERN
+        self.pattern_progress[mask] = 0
+        self.pattern_length[mask] = 0
+        self.consecutive_same_position[mask] = 0
+        self.last_side[mask] = SIDE_NONE
+
+        self.coin_alive[mask] = False
+        self.spawn_timer_coin[mask] = 0
+        self.spawn_interval_coin[mask] = 150
+
+        self.uhr_alive[mask] = False
+        self.uhr2_alive[mask] = False
+        self.spawn_timer_uhr[mask] = 0
+        self.spawn_timer_uhr2[mask] = 0
+        self.spawn_interval_uhr[mask] = self.rng.integers(30 * FPS, 60 * FPS, count, endpoint=True)
+        self.spawn_interval_uhr2[mask] = self.rng.integers(30 * FPS, 60 * FPS, count, endpoint=True)
+        self.clock_spawn_cooldown[mask] = 0
+        self.clock_active[mask] = False
+        self.clock2_active[mask] = False
+        self.clock_timer[mask] = 0
+        self.clock2_timer[mask] = 0
+
+        self.frame[mask] = 0
+        self.timer[mask] = 0
+        self.coins_collected[mask] = 0
+        self.jumps[mask] = 0
+        self.game_over[mask] = False
+
+    # ===== PHYSIK =====
+
+    def is_player_grounded(self):
+        """Check if player is on ground (top or bottom)"""
+        return (((self.player_y == self.ground_y) | (self.player_y == self.ceiling_y)) &
+                ~self.is_moving_up & ~self.is_moving_down)
+
+    def apply_clock_physics(self, mask, clock_type):
+        """Apply physics modifications based on clock type"""
+        if clock_type == 'slow':
+            self.current_movement_speed[mask] = self.original_movement_speed * 0.5
+            self.current_acceleration[mask] = self.original_acceleration * 0.4
+        else:
+            self.current_movement_speed[mask] = self.original_movement_speed * 1.8
+            self.current_acceleration[mask] = self.original_acceleration * 2.5
+
+    def reset_physics(self, mask):
+        """Reset physics to normal values"""
+        self.current_movement_speed[mask] = self.original_movement_speed
+        self.current_acceleration[mask] = self.original_acceleration
+        self.pending_physics_reset[mask] = False
+
+    def handle_jump_input(self, actions):
+        """Sprung/Richtungswechsel für alle Runden mit gedrückter Leertaste"""
+        idle = ~self.is_moving_up & ~self.is_moving_down
+        from_ground = actions & idle & (self.player_y == self.ground_y)
+        from_ceiling = actions & idle & ~from_ground & (self.player_y == self.ceiling_y)
+        flip_down = actions & self.is_moving_up & ~self.air_jump_used
+        flip_up = actions & self.is_moving_down & ~self.air_jump_used
+
+        to_ceiling = from_ground | flip_up
+        to_ground = from_ceiling | flip_down
+        jumped = to_ceiling | to_ground
+        air = flip_down | flip_up
+
+        self.is_moving_up[to_ceiling] = True
+        self.is_moving_down[to_ceiling] = False
+        self.destination_pos[to_ceiling] = self.ceiling_y
+        self.is_moving_down[to_ground] = True
+        self.is_moving_up[to_ground] = False
+        self.destination_pos[to_ground] = self.ground_y
+
+        self.air_jump_used[jumped] = air[jumped]
+        self.movement_speed[jumped] = self.current_movement_speed[jumped] * np.where(air[jumped], 1.2, 1.0)
+        self.jumps += jumped
+        self.game_speed[jumped] += JUMP_SPEEDUP
+
+    def update_player_movement(self, active):
+        """Update player movement with modified physics"""
+        up = self.is_moving_up & active
+        down = self.is_moving_down & active
+        moving = up | down
+
+        self.player_y -= np.where(up, self.movement_speed, 0.0)
+        self.player_y += np.where(down, self.movement_speed, 0.0)
+        self.movement_speed += np.where(moving, self.current_acceleration, 0.0)
+
+        landed = (up & (self.player_y <= self.destination_pos)) | (down & (self.player_y >= self.destination_pos))
+        self.player_y[landed] = self.destination_pos[landed]
+        self.is_moving_up[landed] = False
+        self.is_moving_down[landed] = False
+        self.air_jump_used[landed] = False
+        self.movement_speed[landed] = self.current_movement_speed[landed]
+
+    # ===== UHREN =====
+
+    def _clock_conflict(self, x, y):
+        """Spawn-Konflikt einer Uhr mit lebenden Spikes (pro Runde)"""
+        near = ((np.abs(self.spike_x - x[:, None]) < 200) &
+                (np.abs(self.spike_y - y[:, None]) < 100) & self.spike_alive)
+        return near.any(axis=1)
+
+    def _spawn_clock(self, active, timer, interval, alive, xs, ys, size):
+        """Gemeinsamer Spawn für beide Uhren (spawn_clock_powerup/spawn_clock2_powerup)"""
+        due = active & (timer >= interval)
+        if not due.any():
+            return
+        y = np.where(self.rng.random(self.n) < 0.5, 60, HEIGHT - size - 60)
+        x = np.full(self.n, float(WIDTH))
+        try_spawn = due & ~alive & (self.clock_spawn_cooldown <= 0)
+        spawn = try_spawn & ~self._clock_conflict(x, y)
+        xs[spawn] = x[spawn]
+        ys[spawn] = y[spawn]
+        alive[spawn] = True
+        self.clock_spawn_cooldown[spawn] = 60
+
+        timer[due] = 0
+        interval[due] = self.rng.integers(30 * FPS, 60 * FPS, int(due.sum()), endpoint=True)
+
+    def _collide_box(self, x, y, size):
+        """AABB-Test Spielfigur gegen ein quadratisches Objekt der Kantenlänge size"""
+        return ((self.player_x < x + size) & (self.player_x + self.player_size[0] > x) &
+                (self.player_y < y + size) & (self.player_y + self.player_size[1] > y))
+
+    def update_clock_system(self, active):
+        """Update clock power-up system"""
+        self.clock_spawn_cooldown -= (self.clock_spawn_cooldown > 0) & active
+
+        self.spawn_timer_uhr += active
+        self.spawn_timer_uhr2 += active
+        self._spawn_clock(active, self.spawn_timer_uhr, self.spawn_interval_uhr,
+                          self.uhr_alive, self.uhr_x, self.uhr_y, self.uhr_size)
+        self._spawn_clock(active, self.spawn_timer_uhr2, self.spawn_interval_uhr2,
+                          self.uhr2_alive, self.uhr2_x, self.uhr2_y, self.uhr2_size)
+
+        # Move existing clocks
+        self.uhr_x -= np.where(self.uhr_alive, self.game_speed, 0.0)
+        self.uhr2_x -= np.where(self.uhr2_alive, self.game_speed, 0.0)
+        self.uhr_alive &= self.uhr_x >= -self.uhr_size
+        self.uhr2_alive &= self.uhr2_x >= -self.uhr2_size
+
+        # Check collision with Clock 1 (good), then Clock 2 (bad)
+        hit = (active & self.uhr_alive & ~self.clock_active & ~self.clock2_active &
+               self._collide_box(self.uhr_x, self.uhr_y, self.uhr_size))
+        self.uhr_alive[hit] = False
+        self.clock_active[hit] = True
+        self.clock_timer[hit] = self.clock_duration
+        self.apply_clock_physics(hit, 'slow')
+
+        hit = (active & self.uhr2_alive & ~self.clock_active & ~self.clock2_active &
+               self._collide_box(self.uhr2_x, self.uhr2_y, self.uhr2_size))
+        self.uhr2_alive[hit] = False
+        self.clock2_active[hit] = True
+        self.clock2_timer[hit] = self.clock_duration
+        self.apply_clock_physics(hit, 'fast')
+
+        # Update clock timers
+        grounded = self.is_player_grounded()
+        for clock_active, clock_timer in ((self.clock_active, self.clock_timer),
+                                          (self.clock2_active, self.clock2_timer)):
+            clock_timer -= np.where(clock_active & active, 1 / FPS, 0.0)
+            expired = clock_active & active & (clock_timer <= 0)
+            clock_active[expired] = False
+            self.reset_physics(expired & grounded)
+            self.pending_physics_reset |= expired & ~grounded
+
+        # Check for physics reset when landing
+        self.reset_physics(self.pending_physics_reset & grounded & active)
+
+    # ===== SPIKES =====
+
+    def choose_spike_pattern(self, mask):
+        """Vektorisierte Variante von Game.choose_spike_pattern"""
+        count = int(mask.sum())
+        difficulty = np.minimum(self.coins_collected[mask] / 10.0, 1.0)
+        row = np.where(difficulty < 0.3, 0,
+                       np.where(difficulty < 0.6, 1,
+                                np.where(self.consecutive_same_position[mask] >= 3, 3, 2)))
+        column = (self.rng.random(count) * PATTERN_COUNTS[row]).astype(np.int64)
+        pattern = PATTERN_TABLE[row, column]
+
+        length = self.rng.integers(1, 3, count, endpoint=True)
+        length = np.where(pattern == SAFE_ZONE, self.rng.integers(2, 4, count, endpoint=True), length)
+        length = np.where(pattern == ALTERNATING, self.rng.integers(3, 6, count, endpoint=True), length)
+        length = np.where(pattern == DOUBLE_GAP, 4, length)
+
+        self.current_pattern[mask] = pattern
+        self.pattern_progress[mask] = 0
+        self.pattern_length[mask] = length
+
+    def add_spikes(self, mask, x, top):
+        """Je einen Spike in den ersten freien Slot der markierten Runden legen"""
+        slot = np.argmin(self.spike_alive, axis=1)
+        mask = mask & ~self.spike_alive[np.arange(self.n), slot]  # Runden ohne freien Slot verlieren den Spike
+        rows = np.nonzero(mask)[0]
+        slot = slot[rows]
+        self.spike_x[rows, slot] = x
+        self.spike_y[rows, slot] = np.where(top[rows], self.spike_top_y, self.spike_bottom_y)
+        self.spike_alive[rows, slot] = True
+
+    def spawn_spike_with_pattern(self, mask):
+        """Spawnt Spikes basierend auf dem aktuellen Muster"""
+        pattern = self.current_pattern
+        progress = self.pattern_progress
+
+        top = ((pattern == SINGLE_TOP) | (pattern == GAP_BOTTOM) |
+               ((pattern == ALTERNATING) & (progress % 2 == 0)) |
+               ((pattern == DOUBLE_GAP) & (progress != 2)))
+        tracked = mask & (pattern != SAFE_ZONE) & (pattern != DOUBLE_GAP)
+        spawn = mask & (pattern != SAFE_ZONE)
+
+        self.add_spikes(spawn, WIDTH, top)
+        # Doppelte Blockade: zusätzlicher Spike unten, leicht versetzt
+        double = mask & (pattern == DOUBLE_GAP) & ((progress == 0) | (progress == 3))
+        if double.any():
+            self.add_spikes(double, WIDTH + self.spike_size + 10, np.zeros(self.n, dtype=bool))
+
+        # track_spike_position
+        side = np.where(top, SIDE_TOP, SIDE_BOTTOM).astype(np.int8)
+        same = tracked & (self.last_side == side)
+        self.consecutive_same_position[same] += 1
+        self.consecutive_same_position[tracked & ~same] = 0
+        self.last_side[tracked] = side[tracked]
+
+    def update_spikes(self, active):
+        """Spike-Spawn nach Muster, Bewegung und Entfernung alter Spikes"""
+        due = active & (self.spawn_timer_spike >= self.spawn_interval_spike)
+        if due.any():
+            new_pattern = due & ((self.current_pattern == NO_PATTERN) |
+                                 (self.pattern_progress >= self.pattern_length))
+            if new_pattern.any():
+                self.choose_spike_pattern(new_pattern)
+            self.spawn_spike_with_pattern(due)
+            self.pattern_progress += due
+            self.spawn_timer_spike[due] = 0
+        self.spawn_timer_spike += active
+
+        # Bewegung (tote Runden haben game_speed 0) und Entfernung alter Spikes
+        self.spike_x -= self.game_speed[:, None]
+        self.spike_alive &= self.spike_x >= -self.spike_size
+
+    # ===== MÜNZE =====
+
+    def update_coin(self, active):
+        """Münz-Spawn, Bewegung und Einsammeln"""
+        due = active & (self.spawn_timer_coin >= self.spawn_interval_coin) & ~self.coin_alive
+        if due.any():
+            y = np.where(self.rng.random(self.n) < 0.5, 40, HEIGHT - self.coin_size - 40)
+            blocked = ((self.spike_x < WIDTH + self.coin_size) &
+                       (self.spike_x + self.spike_size > WIDTH) &
+                       (self.spike_y == y[:, None]) & self.spike_alive).any(axis=1)
+            spawn = due & ~blocked
+            self.coin_x[spawn] = WIDTH
+            self.coin_y[spawn] = y[spawn]
+            self.coin_alive[spawn] = True
+            self.spawn_timer_coin[due] = 0
+        self.spawn_timer_coin += active
+
+        self.coin_x -= np.where(self.coin_alive, self.game_speed, 0.0)
+        self.coin_alive &= self.coin_x >= -self.coin_size
+
+        hit = active & self.coin_alive & self._collide_box(self.coin_x, self.coin_y, self.coin_size)
+        self.coin_alive[hit] = False
+        self.coins_collected += hit
+        self.game_speed[hit] += 0.1
+        self.spawn_interval_coin[hit] = np.maximum(50, self.spawn_interval_coin[hit] - 10)
+        self.spawn_interval_spike[hit] = np.maximum(80, self.spawn_interval_spike[hit] - 20)
+
+    # ===== KOLLISION =====
+
+    def check_spike_collision(self):
+        """AABB-Test aller Spikes gegen die Spielfigur (Hitboxen auf 80 %)"""
+        player_top = np.trunc(self.player_y + self.player_hit_dy)[:, None]
+        spike_left = np.trunc(self.spike_x + self.spike_hit_d)
+        spike_top = np.trunc(self.spike_y + self.spike_hit_d)
+        hit = (self.spike_alive &
+               (self.player_hit_x < spike_left + self.spike_hit_w) &
+               (self.player_hit_x + self.player_hit_w > spike_left) &
+               (player_top < spike_top + self.spike_hit_w) &
+               (player_top + self.player_hit_h > spike_top))
+        return hit.any(axis=1)
+
+    # ===== FRAME =====
+
+    def step(self, actions=None):
+        """Rückt alle laufenden Runden um einen Frame vor; actions = Leertaste je Runde"""
+        active = ~self.game_over
+        if actions is not None:
+            self.handle_jump_input(np.asarray(actions, dtype=bool) & active)
+
+        self.update_clock_system(active)
+        self.update_player_movement(active)
+        self.update_spikes(active)
+        self.update_coin(active)
+
+        died = self.died = active & self.check_spike_collision()
+        if died.any():
+            self.score[died] = calculate_scores(self.coins_collected[died], self.timer[died], self.jumps[died])
+            self.game_over |= died
+            self.game_speed[died] = 0
+            self.movement_speed[died] = 1
+
+        survived = active & ~died
+        self.timer += np.where(survived, 1 / FPS, 0.0)
+        self.game_speed += np.where(survived, FRAME_SPEEDUP, 0.0)
+        self.frame += survived
+
+        if self.auto_reset and died.any():
+            self.reset(died)
+        return self.state()
+
+    def state(self):
+        """Zustand aller Runden als Dictionary von Arrays (Views, keine Kopien)"""
+        return {
+            'frame': self.frame,
+            'player_y': self.player_y,
+            'is_moving_up': self.is_moving_up,
+            'is_moving_down': self.is_moving_down,
+            'game_speed': self.game_speed,
+            'spike_x': self.spike_x,
+            'spike_y': self.spike_y,
+            'spike_alive': self.spike_alive,
+            'timer': self.timer,
+            'coins': self.coins_collected,
+            'jumps': self.jumps,
+            'game_over': self.game_over,
+            'died': self.died,
+            'score': self.score,
+        }
+
+
+def calculate_scores(coins, time_survived, jumps):
+    """calculate_score für Arrays"""
+    return (np.trunc(time_survived * 10).astype(np.int64) + coins * 10 +
+            (coins * 50 // np.maximum(jumps, 1)))
+
+
+def run_benchmark(n, frames, jump_chance):
+    """Misst den Gesamtdurchsatz von n parallelen Runden"""
+    runner = BatchRunner(n, seed=0, auto_reset=True)
+    rng = np.random.default_rng(1)
+    start = time.perf_counter()
+    for _ in range(frames):
+        runner.step(rng.random(n) < jump_chance)
+    elapsed = time.perf_counter() - start
+
+    fps = n * frames / elapsed
+    print(f"{n} Runden x {frames} Frames in {elapsed:.2f}s")
+    print(f"{fps:,.0f} Frames/s = {fps / FPS:,.0f}x Echtzeit")
+
+
+if __name__ == '__main__':
+    enable_headless()
+    batch_size = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    batch_frames = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    run_benchmark(batch_size, batch_frames, 0.02)
@@ -0,0 +1,248 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from array import array
+
+import pygame
+
+from bots import spike_dodger
+from game import FPS
+from stats import percentile
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(BASE_DIR, '..', 'data')
+
+# Szenario -> (Frames, Beschreibung); main.py --benchmark NAME spielt es ab
+SCENARIOS = {
+    'spikes': (3600, "Maximale Spike-Dichte: alle Muster, spawn_interval_spike = 80"),
+    'clocks': (3600, "Beide Uhr-Tönungen gleichzeitig aktiv"),
+    'death_screen': (3600, "Death Screen mit voller Top 10"),
+    'long_run': (30 * 60 * FPS, "Eine Runde über 30 Minuten Spielzeit (Spikes töten nicht)"),
+}
+
+# Frames der zweiten Messung mit tracemalloc (verlangsamt stark)
+MEMORY_FRAMES = 600
+
+
+def setup_scenario(name, game):
+    """Spielzustand für das Szenario herstellen (nach jedem Reset erneut)"""
+    if name == 'spikes':
+        game.coins_collected = 10  # Schwierigkeit 1.0: alle Muster verfügbar
+        game.spawn_interval_spike = 80
+    elif name == 'clocks':
+        game.clock_active = game.clock2_active = True
+        game.clock_timer = game.clock2_timer = float('inf')
+    elif name == 'long_run':
+        # Spikes werden weiter geprüft, beenden die Runde aber nicht: eine Runde
+        # erreicht so den Zustand nach 30 Minuten (hohe game_speed, langer Timer)
+        for kind in game.spike_kinds:
+            game.entities.kinds[kind].on_collide = lambda index: False
+
+
+def sample_rankings(count=10):
+    """Volle Top 10 für den Death Screen (ohne Netzwerk)"""
+    return [{'name': f"SPIELER{i + 1}", 'score': 5000 - 350 * i} for i in range(count)]
+
+
+def summarize(values):
+    """p50, p99 und Maximum"""
+    values = sorted(values)
+    return {
+        'p50': percentile(values, 50),
+        'p99': percentile(values, 99),
+        'max': values[-1] if values else 0,
+    }
+
+
+class BenchmarkRun:
+    """Ein Szenario im echten Spielloop von main.py messen
+
+    Die Eingaben kommen vom Bot spike_dodger und laufen als KEYDOWN-Events
+    durch das normale Event-Handling; jeder Frame simuliert genau einen
+    Schritt. Erst werden frames Frames ohne tracemalloc gemessen (Frames/s,
+    Frame-Zeiten, Wachstum der belegten Speicherblöcke), danach
+    MEMORY_FRAMES Frames mit tracemalloc (pro Frame neu belegter Speicher und
+    die Stellen, an denen während der Messung Speicher liegen bleibt).
+    """
+
+    frame_time = 1 / FPS  # Feste Simulationszeit pro Frame
+
+    def __init__(self, scenario, frames=None, output=None, seed=0):
+        self.scenario = scenario
+        self.frames = frames or SCENARIOS[scenario][0]
+        self.memory_frames = min(self.frames, MEMORY_FRAMES)
+        self.output = output
+        self.seed = seed
+        self.plays = scenario != 'death_screen'
+
+        self.phase = 'speed'
+        self.count = 0
+        self.rounds = 0
+        self.frame_ms = array('d')  # Ohne eigene Speicherblöcke pro Frame
+        self.memory = []  # (neu belegt, liegen geblieben) pro Frame in Bytes
+
+    def start(self, game):
+        self.restart(game)
+        self.blocks_start = sys.getallocatedblocks()
+        self.started = self.last = time.perf_counter()
+
+    def restart(self, game):
+        """Neue Runde mit festem Seed (nach dem Tod im Szenario)"""
+        game.reset(self.seed + self.rounds)
+        self.rounds += 1
+        setup_scenario(self.scenario, game)
+
+    def script_input(self, game):
+        """Bot-Entscheidung als Tastendruck einspeisen"""
+        if self.plays and not game.game_over and spike_dodger(game.state()):
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE, unicode=' '))
+
+    def frame_done(self):
+        """Nach jedem Frame aufrufen; True, wenn das Szenario fertig ist"""
+        now = time.perf_counter()
+        self.count += 1
+
+        if self.phase == 'speed':
+            self.frame_ms.append((now - self.last) * 1000)
+            if self.count == self.frames:
+                self.speed_seconds = now - self.started
+                self.block_growth = sys.getallocatedblocks() - self.blocks_start
+                self.phase = 'memory'
+                self.count = 0
+                tracemalloc.start()
+                self.snapshot = tracemalloc.take_snapshot()
+                self._start_memory_frame()
+        else:
+            current, peak = tracemalloc.get_traced_memory()
+            self.memory.append((peak - self.memory_start, current - self.memory_start))
+            if self.count == self.memory_frames:
+                self.finish()
+                return True
+            self._start_memory_frame()
+
+        self.last = time.perf_counter()
+        return False
+
+    def _start_memory_frame(self):
+        tracemalloc.reset_peak()
+        self.memory_start = tracemalloc.get_traced_memory()[0]
+
+    def finish(self):
+        top = tracemalloc.take_snapshot().compare_to(self.snapshot, 'lineno')
+        tracemalloc.stop()
+        # Nur Stellen im Spiel selbst, nicht tracemalloc oder diese Messung
+        top = [stat for stat in top if stat.count_diff > 0 and BASE_DIR in str(stat.traceback)
+               and os.path.abspath(__file__) not in str(stat.traceback)]
+
+        allocated = [allocated for allocated, _ in self.memory]
+        retained = sum(kept for _, kept in self.memory)
+        self.result = {
+            'scenario': self.scenario,
+            'description': SCENARIOS[self.scenario][1],
+            'frames': self.frames,
+            'rounds': self.rounds,
+            'seconds': self.speed_seconds,
+            'fps': self.frames / self.speed_seconds,
+            'frame_ms': summarize(self.frame_ms),
+            'block_growth': self.block_growth,
+            'memory': {
+                'frames': self.memory_frames,
+                'allocated_bytes_per_frame': summarize(allocated),
+                'retained_bytes_per_frame': retained / self.memory_frames,
+                'top_retained': [
+                    {'site': str(stat.traceback), 'count': stat.count_diff, 'bytes': stat.size_diff}
+                    for stat in top[:5]
+                ],
+            },
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'video_driver': pygame.display.get_driver() if pygame.display.get_init() else None,
+        }
+        if self.output:
+            with open(self.output, 'w', encoding='utf-8') as f:
+                json.dump(self.result, f, indent=2)
+
+
+def run_scenario(name, frames=None, window=False):
+    """main.py --benchmark NAME in einem eigenen Prozess ausführen und das Ergebnis lesen"""
+    env = dict(os.environ)
+    if not window:
+        env.setdefault('SDL_VIDEODRIVER', 'dummy')
+    env.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+    fd, output = tempfile.mkstemp(suffix='.json')
+    os.close(fd)
+    try:
+        command = [sys.executable, os.path.join(BASE_DIR, 'main.py'), '--benchmark', name, '--output', output]
+        if frames:
+            command += ['--frames', str(frames)]
+        subprocess.run(command, check=True, cwd=BASE_DIR, env=env, stdout=subprocess.DEVNULL)
+        with open(output, encoding='utf-8') as f:
+            return json.load(f)
+    finally:
+        os.remove(output)
+
+
+def compare(results, baseline, tolerance):
+    """Rückschritte gegenüber einer früheren Ergebnisdatei (Frames/s und p99)"""
+    previous = {result['scenario']: result for result in baseline['results']}
+    regressions = []
+    for result in results:
+        old = previous.get(result['scenario'])
+        if not old:
+            continue
+        if result['fps'] < old['fps'] * (1 - tolerance):
+            regressions.append(f"{result['scenario']}: {old['fps']:.0f} -> {result['fps']:.0f} Frames/s")
+        if result['frame_ms']['p99'] > old['frame_ms']['p99'] * (1 + tolerance):
+            regressions.append(f"{result['scenario']}: p99 {old['frame_ms']['p99']:.2f} -> "
+                               f"{result['frame_ms']['p99']:.2f} ms")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark-Szenarien des Spielloops")
+    parser.add_argument('scenarios', nargs='*', metavar='SZENARIO',
+                        help=f"Auswahl aus {', '.join(SCENARIOS)} (Standard: alle)")
+    parser.add_argument('--frames', type=int, help="Frames pro Szenario statt der Voreinstellung")
+    parser.add_argument('--output', default=os.path.join(DATA_DIR, 'benchmark.json'), help="Ergebnisdatei (JSON)")
+    parser.add_argument('--baseline', help="Frühere Ergebnisdatei zum Vergleich")
+    parser.add_argument('--tolerance', type=float, default=0.1,
+                        help="Erlaubte Verschlechterung (Standard 0.1 = 10 %%)")
+    parser.add_argument('--window', action='store_true', help="Echtes Fenster statt SDL-Dummy-Treiber")
+    args = parser.parse_args()
+
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"Unbekanntes Szenario: {', '.join(unknown)}")
+
+    results = []
+    for name in args.scenarios or SCENARIOS:
+        result = run_scenario(name, args.frames, args.window)
+        results.append(result)
+        memory = result['memory']
+        print(f"{name:>13}: {result['fps']:7.0f} Frames/s  p50 {result['frame_ms']['p50']:.2f} ms  "
+              f"p99 {result['frame_ms']['p99']:.2f} ms  "
+              f"{memory['allocated_bytes_per_frame']['p50']:.0f} B/Frame belegt  "
+              f"{memory['retained_bytes_per_frame']:.1f} B/Frame liegen geblieben")
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump({'date': time.strftime('%Y-%m-%d %H:%M'), 'results': results}, f, indent=2)
+    print(f"Ergebnisse: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for regression in regressions:
+            print(f"RÜCKSCHRITT {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
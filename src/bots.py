@@ -0,0 +1,65 @@
+import random
+
+from game import HEIGHT
+from trajectory import JumpTable
+
+# Bots bekommen den Zustand aus Game.step()/Game.state() und liefern
+# True zurück, wenn in diesem Frame die Leertaste gedrückt werden soll.
+
+
+def never_jump(state):
+    """Drückt nie (Referenz für den schlechtesten Fall)"""
+    return False
+
+
+def random_jumper(state):
+    """Drückt in etwa jedem 30. Frame"""
+    return random.random() < 1 / 30
+
+
+def spike_dodger(state, reaction_distance=110):
+    """Springt, sobald ein Spike auf der eigenen Seite zu nahe kommt"""
+    if state['is_moving_up'] or state['is_moving_down']:
+        return False
+
+    player_x, player_y = state['player_pos']
+    on_ground = player_y > HEIGHT / 2
+    for spike_x, spike_y in state['spikes']:
+        if (spike_y > HEIGHT / 2) == on_ground and 0 <= spike_x - player_x < reaction_distance:
+            return True
+    return False
+
+
+_jump_table = None
+
+
+def jump_planner(state, lookahead=20, rest=10):
+    """Springt, sobald Stehenbleiben einen Spike trifft und der Sprung samt rest Frames nach der Landung sicher ist
+
+    Ob ein Sprung die Spikes überwindet, kommt aus den Flugbahn-Tabellen
+    (trajectory.JumpTable), ohne das Spiel weiterzusimulieren. Ist jetzt
+    kein Sprung sicher, wartet der Bot, falls einer der nächsten lookahead
+    Frames es ist.
+    """
+    global _jump_table
+    if state['is_moving_up'] or state['is_moving_down'] or not state['spikes']:
+        return False
+    if _jump_table is None:
+        _jump_table = JumpTable()
+    table = _jump_table
+
+    start_y = state['player_pos'][1]
+    spikes, game_speed, mode = state['spikes'], state['game_speed'], state['physics']
+    if table.first_hit((start_y,) * lookahead, (), spikes, game_speed) is None:
+        return False
+    if table.clears(spikes, game_speed, mode, start_y, rest=rest):
+        return True
+    return not table.safe_delays(spikes, game_speed, mode, start_y, max_delay=lookahead, rest=rest)
+
+
+POLICIES = {
+    'never_jump': never_jump,
+    'random_jumper': random_jumper,
+    'spike_dodger': spike_dodger,
+    'jump_planner': jump_planner,
+}
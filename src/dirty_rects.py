@@ -0,0 +1,63 @@
+import pygame
+
+
+class DirtyRects:
+    """Optionales Dirty-Rect-Rendering statt screen.fill + display.flip in jedem Frame
+
+    Während des Spiels wird nur dort der Hintergrund wiederhergestellt, wo im
+    letzten Frame etwas gezeichnet wurde, und pygame.display.update bekommt
+    nur diese Rechtecke plus die neu gezeichneten. Ganzflächige Effekte
+    (Uhr-Tönung) rufen invalidate() auf und erzwingen ein komplettes Frame.
+    Statische Overlays werden nur geblittet und angezeigt, wenn sie sich
+    geändert haben. Mit enabled=False verhält sich alles wie bisher.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.rects = []  # In diesem Frame gezeichnet
+        self.previous = []  # Im letzten Frame gezeichnet, wird zuerst gelöscht
+        self.full_redraw = True  # Hintergrund komplett neu füllen
+        self.full_update = True  # Ganzes Fenster anzeigen
+        self.static_layer = None  # Aktuell angezeigtes statisches Overlay
+
+    def invalidate(self):
+        """Dieses Frame komplett anzeigen und das nächste komplett neu zeichnen"""
+        self.full_redraw = True
+        self.full_update = True
+
+    def begin(self, screen, color):
+        """Hintergrund für ein Spiel-Frame wiederherstellen"""
+        self.static_layer = None
+        if not self.enabled or self.full_redraw:
+            screen.fill(color)
+            self.full_redraw = False
+            self.full_update = True
+        else:
+            for rect in self.previous:
+                screen.fill(color, rect)
+
+    def add(self, rect):
+        """Gezeichnetes Rechteck (Rückgabe von screen.blit) vormerken"""
+        self.rects.append(rect)
+        return rect
+
+    def extend(self, rects):
+        self.rects.extend(rects)
+
+    def show_layer(self, screen, layer, key):
+        """Statisches Overlay (RetainedLayer) zeigen; unverändert kostet es nichts"""
+        surface = layer.get(key)
+        if not self.enabled or layer.changed or self.static_layer is not layer:
+            screen.blit(surface, (0, 0))
+            self.static_layer = layer
+            self.invalidate()
+
+    def present(self):
+        """Frame anzeigen: komplett per flip oder nur die geänderten Rechtecke"""
+        if not self.enabled or self.full_update:
+            pygame.display.flip()
+        elif self.rects or self.previous:
+            pygame.display.update(self.previous + self.rects)
+        self.full_update = False
+        self.previous = self.rects
+        self.rects = []
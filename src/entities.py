@@ -0,0 +1,208 @@
+from array import array
+
+
+class EntityKind:
+    """Art von Objekten in der EntityTable (Münze, Uhr, Spike, ...)
+
+    margin=None prüft die volle Bildgröße von Objekt und Spielfigur mit
+    float-Koordinaten. Mit einem Rand (z.B. 0.1 = 10 % je Seite) werden beide
+    Boxen mittig verkleinert und wie bei pygame.Rect auf ganze Pixel
+    abgeschnitten.
+    on_collide(index) wird bei Berührung aufgerufen; gibt es True zurück,
+    endet der Kollisionsdurchlauf.
+    """
+
+    def __init__(self, name, size, player_size, margin=None, on_collide=None):
+        self.name = name
+        self.width, self.height = size
+        self.on_collide = on_collide
+        self.truncate = margin is not None
+
+        # (x-Versatz, y-Versatz, Breite, Höhe) von Objekt und Spielfigur
+        self.box = self._box(size, margin)
+        self.player_box = self._box(player_size, margin)
+
+    def _box(self, size, margin):
+        width, height = size
+        if margin is None:
+            return 0.0, 0.0, width, height
+        scale = 1 - 2 * margin
+        return width * margin, height * margin, int(width * scale), int(height * scale)
+
+
+class EntityTable:
+    """Alle Pickups und Hindernisse in parallelen Arrays (Art, x, y, lebt)
+
+    Jedes Objekt erscheint am rechten Rand (höchstens spread Pixel weiter
+    rechts) und läuft mit game_speed nach links. Die Slots start..end-1 sind
+    deshalb in Spawn-Reihenfolge und bis auf spread nach x sortiert: Bewegen
+    und Aussortieren ist ein gemeinsamer Durchlauf, Kollisionen und
+    Spawn-Konflikte prüfen nur ein Fenster um die gesuchte x-Position.
+    Entfernte Objekte werden nur als tot markiert; ihre Slots werden vorne
+    freigegeben und wiederverwendet.
+    """
+
+    def __init__(self, player_size, spread=0, capacity=32):
+        self.player_size = player_size
+        self.spread = spread
+        self.kinds = []
+        self.counts = []  # Lebende Objekte je Art
+        self.cull_x = []  # Objekte links davon sind ganz vom Bildschirm verschwunden
+        self._boxes = {}  # kinds -> (Position der Spielfigur, Boxen) des letzten hits()-Aufrufs
+
+        self.kind = array('b', bytes(capacity))
+        self.x = array('d', bytes(8 * capacity))
+        self.y = array('d', bytes(8 * capacity))
+        self.alive = array('b', bytes(capacity))
+        self.start = 0
+        self.end = 0
+
+    def add_kind(self, name, size, margin=None, on_collide=None):
+        """Neue Art anlegen; gibt ihre Nummer zurück"""
+        self.kinds.append(EntityKind(name, size, self.player_size, margin, on_collide))
+        self.counts.append(0)
+        self.cull_x.append(-size[0])
+        self._boxes.clear()
+        return len(self.kinds) - 1
+
+    def __len__(self):
+        return sum(self.counts)
+
+    def __iter__(self):
+        """(Art, x, y) aller lebenden Objekte, älteste zuerst"""
+        kind, x, y, alive = self.kind, self.x, self.y, self.alive
+        for i in range(self.start, self.end):
+            if alive[i]:
+                yield kind[i], x[i], y[i]
+
+    def count(self, kind):
+        return self.counts[kind]
+
+    def positions(self, kinds):
+        """[(x, y), ...] der lebenden Objekte der Arten kinds"""
+        kind, x, y, alive = self.kind, self.x, self.y, self.alive
+        return [(x[i], y[i]) for i in range(self.start, self.end) if alive[i] and kind[i] in kinds]
+
+    def first(self, kind):
+        """Position (x, y) des ältesten Objekts dieser Art oder None"""
+        if self.counts[kind]:
+            for i in range(self.start, self.end):
+                if self.alive[i] and self.kind[i] == kind:
+                    return self.x[i], self.y[i]
+        return None
+
+    def clear(self):
+        self.start = self.end = 0
+        self.counts = [0] * len(self.kinds)
+
+    def add(self, kind, x, y):
+        if self.end == len(self.x):
+            self._make_room()
+        i = self.end
+        self.kind[i] = kind
+        self.x[i] = x
+        self.y[i] = y
+        self.alive[i] = 1
+        self.end = i + 1
+        self.counts[kind] += 1
+
+    def remove(self, i):
+        self.alive[i] = 0
+        self.counts[self.kind[i]] -= 1
+
+    def _make_room(self):
+        """Lebende Objekte an den Anfang schieben, bei vollem Puffer Kapazität verdoppeln"""
+        kind, x, y, alive = self.kind, self.x, self.y, self.alive
+        count = 0
+        for i in range(self.start, self.end):
+            if alive[i]:
+                kind[count], x[count], y[count] = kind[i], x[i], y[i]
+                alive[count] = 1
+                count += 1
+        for i in range(count, self.end):
+            alive[i] = 0
+        self.start, self.end = 0, count
+        if count == len(x):
+            kind.extend(bytes(count))
+            x.extend(x)
+            y.extend(y)
+            alive.extend(bytes(count))
+
+    def move(self, distance):
+        """Alle Objekte um distance nach links schieben, ganz verschwundene entfernen"""
+        kind, x, alive, cull_x = self.kind, self.x, self.alive, self.cull_x
+        for i in range(self.start, self.end):
+            if alive[i]:
+                x[i] -= distance
+                if x[i] < cull_x[kind[i]]:
+                    self.remove(i)
+        while self.start < self.end and not alive[self.start]:
+            self.start += 1
+        if self.start == self.end:
+            self.start = self.end = 0
+
+    def scan_back(self, min_x):
+        """Indizes lebender Objekte von rechts nach links, bis keines mehr x >= min_x haben kann"""
+        x, alive = self.x, self.alive
+        limit = min_x - self.spread
+        for i in range(self.end - 1, self.start - 1, -1):
+            if alive[i]:
+                if x[i] < limit:
+                    return
+                yield i
+
+    def hits(self, player_x, player_y, kinds):
+        """Indizes aller lebenden Objekte der Arten kinds, die die Spielfigur berühren"""
+        counts = self.counts
+        for k in kinds:
+            if counts[k]:
+                break
+        else:
+            return []
+
+        # Boxen der Spielfigur je Art (None für nicht gesuchte Arten); die
+        # Spielfigur steht meist still, dann gilt die Rechnung vom letzten Mal
+        position, boxes = self._boxes.get(kinds, (None, None))
+        if position != (player_x, player_y):
+            boxes = [None] * len(self.kinds)
+            for k in kinds:
+                entity_kind = self.kinds[k]
+                offset_x, offset_y, width, height = entity_kind.player_box
+                left = player_x + offset_x
+                top = player_y + offset_y
+                if entity_kind.truncate:
+                    left, top = int(left), int(top)
+                boxes[k] = (left, left + width, top, top + height) + entity_kind.box + (entity_kind.truncate,)
+            self._boxes[kinds] = ((player_x, player_y), boxes)
+
+        found = []
+        x_limit = player_x + self.player_size[0] + self.spread
+        kind, x, y, alive = self.kind, self.x, self.y, self.alive
+        for i in range(self.start, self.end):
+            if not alive[i]:
+                continue
+            entity_x = x[i]
+            if entity_x > x_limit:
+                # Alle folgenden liegen rechts der Spielfigur
+                break
+            box = boxes[kind[i]]
+            if box is None:
+                continue
+            left, right, top, bottom, offset_x, offset_y, width, height, truncate = box
+            entity_left = entity_x + offset_x
+            if truncate:
+                entity_left = int(entity_left)
+            if entity_left >= right or entity_left + width <= left:
+                continue
+            entity_top = y[i] + offset_y
+            if truncate:
+                entity_top = int(entity_top)
+            if entity_top < bottom and entity_top + height > top:
+                found.append(i)
+        return found
+
+    def collide(self, player_x, player_y, kinds):
+        """Kollisionsdurchlauf: on_collide der jeweiligen Art für jeden Treffer aufrufen"""
+        for i in self.hits(player_x, player_y, kinds):
+            if self.kinds[self.kind[i]].on_collide(i):
+                return
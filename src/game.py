@@ -0,0 +1,714 @@
+import os
+import random
+import sys
+import time
+
+import pygame
+
+from entities import EntityTable
+from sprites import SPRITE_FILES, load_scaled_image
+
+# Bildschirmparameter
+WIDTH, HEIGHT = 500, 800
+
+# Simulationsrate (ein Schritt = ein Frame)
+FPS = 60
+
+# Zuwachs von game_speed pro Sprung und pro überlebtem Frame
+JUMP_SPEEDUP = 0.01
+FRAME_SPEEDUP = 0.001
+
+SPIKE_PATTERNS = [
+    "single_top",  # Einzelner Spike oben
+    "single_bottom",  # Einzelner Spike unten
+    "alternating",  # Abwechselnd oben/unten
+    "gap_top",  # Lücke oben (Spike unten)
+    "gap_bottom",  # Lücke unten (Spike oben)
+    "double_gap",  # Zwei Spikes mit Lücke
+    "safe_zone"  # Keine Spikes (Erholung)
+]
+
+_asset_sizes = None
+
+
+def enable_headless():
+    """SDL ohne Fenster und Audio betreiben (für Bots und Simulationen)"""
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+
+def calculate_score(coins, time_survived, jumps):
+    """Berechnet den Gesamtscore"""
+    base_score = int(time_survived * 10)  # 10 Punkte pro Sekunde
+    coin_bonus = coins * 10  # 10 Punkte pro Münze
+    efficiency_bonus = int((coins * 50) / max(jumps, 1))  # Bonus für effiziientes Spielen
+    return base_score + coin_bonus + efficiency_bonus
+
+
+def asset_sizes():
+    """Größen der skalierten Sprites, einmalig aus den Bildern gelesen (ohne Display)"""
+    global _asset_sizes
+
+    if _asset_sizes is None:
+        def scaled_size(key):
+            path, scale, _ = SPRITE_FILES[key]
+            return load_scaled_image(path, scale).get_size()
+
+        _asset_sizes = {
+            'player': scaled_size('player_down'),
+            'coin': scaled_size('coin')[0],
+            'uhr': scaled_size('uhr')[0],
+            'uhr2': scaled_size('uhr2')[0],
+            'spike': scaled_size('spike')[0],
+        }
+    return _asset_sizes
+
+
+class Game:
+    """Kompletter Spielzustand einer Runde, Schritt für Schritt simulierbar
+
+    Enthält nur die Spiellogik: keine Surfaces, kein Zeichnen und kein
+    clock.tick. Das Fenster in main.py und headless Bots nutzen dieselbe
+    Instanz über handle_jump_input()/update() bzw. step(action).
+    """
+
+    def __init__(self, sizes=None, seed=None):
+        sizes = sizes or asset_sizes()
+        self.player_size = sizes['player']
+        self.coin_size = sizes['coin']
+        self.uhr_size = sizes['uhr']
+        self.uhr2_size = sizes['uhr2']
+        self.spike_size = sizes['spike']
+
+        # Bodenhöhe (unten) und Deckenhöhe (oben) der Spielfigur
+        self.ground_y = HEIGHT - self.player_size[1] - 40
+        self.ceiling_y = 40
+
+        # Pickups und Hindernisse in einer Tabelle. Der zweite Spike bei
+        # double_gap liegt spike_size + 10 weiter rechts; um höchstens diesen
+        # Abstand ist die Tabelle nicht nach x sortiert
+        self.spike_spread = self.spike_size + 10
+        self.entities = EntityTable(self.player_size, spread=self.spike_spread)
+        entities = self.entities
+        # Namen wie die Sprites; Spikes mit 80 % Hitbox wie bisher über pygame.Rect
+        self.coin_kind = entities.add_kind('coin', (self.coin_size, self.coin_size), on_collide=self.collect_coin)
+        self.uhr_kind = entities.add_kind('uhr', (self.uhr_size, self.uhr_size), on_collide=self.collect_clock)
+        self.uhr2_kind = entities.add_kind('uhr2', (self.uhr2_size, self.uhr2_size), on_collide=self.collect_clock2)
+        spike_size = (self.spike_size, self.spike_size)
+        self.spike_kind = entities.add_kind('spike', spike_size, margin=0.1, on_collide=self.hit_spike)
+        self.spike_top_kind = entities.add_kind('spike_reverse', spike_size, margin=0.1, on_collide=self.hit_spike)
+        self.spike_kinds = (self.spike_kind, self.spike_top_kind)
+        # Uhren werden vor der Bewegung der Spielfigur eingesammelt (sie ändern
+        # deren Physik), Münze und Spikes danach
+        self.clock_kinds = (self.uhr_kind, self.uhr2_kind)
+        self.contact_kinds = (self.coin_kind,) + self.spike_kinds
+
+        # Optional: on_sound(name) bei 'jump', 'coin', 'clock', 'clock2' und 'death' (Audio in main.py)
+        self.on_sound = None
+
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        """Setzt alle Werte auf den Stand einer neuen Runde
+
+        Jede Runde hat einen eigenen Zufallsgenerator. Ohne seed wird ein
+        neuer gezogen; zusammen mit input_log reicht er, um die Runde
+        frameexakt nachzuspielen (siehe replay.py).
+        """
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        rng = self.rng
+
+        # Globale Geschwindigkeitsvariable
+        self.game_speed = 6.0
+
+        # Spielfigur
+        self.player_pos = [50, self.ground_y]
+        self.player_up = False  # Figur hängt an der Decke (gespiegeltes Bild)
+        self.movement_speed = 0.001
+        self.is_moving_up = False
+        self.is_moving_down = False
+        self.destination_pos = self.ground_y
+        self.air_jump_used = False
+
+        # Pickups und Hindernisse (Münze, Uhren, Spikes)
+        self.entities.clear()
+        self.spike_hit = False
+
+        # Münze
+        self.spawn_timer_coin = 0
+        self.spawn_interval_coin = 150
+
+        # ===== CLOCK POWER-UP SYSTEM =====
+        # Uhr 1 (Good - Slow Time)
+        self.spawn_timer_uhr = 0
+        self.spawn_interval_uhr = rng.randint(30 * FPS, 60 * FPS)  # 30-60 seconds
+
+        # Uhr 2 (Bad - Fast Time)
+        self.spawn_timer_uhr2 = 0
+        self.spawn_interval_uhr2 = rng.randint(30 * FPS, 60 * FPS)  # 30-60 seconds
+
+        # Clock Power-up System Variables
+        self.clock_active = False
+        self.clock2_active = False
+        self.clock_timer = 0
+        self.clock2_timer = 0
+        self.clock_duration = 10.0  # 10 seconds effect duration
+        self.clock_spawn_cooldown = 0  # Prevents both clocks spawning at same time
+
+        # Physics modification variables
+        self.original_movement_speed = 0.6
+        self.original_acceleration = 7
+        self.current_movement_speed = 0.6
+        self.current_acceleration = 7
+
+        # Physics states
+        self.physics_modified = False
+        self.pending_physics_reset = False
+        self.modified_physics_type = None  # 'slow' or 'fast'
+
+        # Hindernis (Spikes)
+        self.spawn_timer_spike = 0
+        self.min_spawn_interval_spike = int(0.25 * FPS)  # Mindestabstand in Frames (0,25 Sekunden)
+        self.spawn_interval_spike = self.min_spawn_interval_spike * 3
+
+        # Erweiterte Spike-Spawn-Variablen
+        self.last_spike_positions = []  # Speichert die letzten Spike-Positionen
+        self.consecutive_same_position = 0  # Zählt aufeinanderfolgende Spikes an gleicher Position
+        self.spike_patterns = SPIKE_PATTERNS
+        self.current_pattern = None
+        self.pattern_progress = 0
+        self.pattern_length = 0
+
+        # Punkte, Timer und Sprünge
+        self.frame = 0
+        self.timer = 0
+        self.coins_collected = 0
+        self.jumps = 0
+        self.input_log = []  # Frames, in denen die Leertaste gedrückt wurde
+
+        # Spielstatus
+        self.game_over = False
+        self.death_cause = None
+        self.score = 0
+
+    # ===== CLOCK POWER-UP FUNCTIONS =====
+
+    def apply_clock_physics(self, clock_type):
+        """Apply physics modifications based on clock type"""
+        if clock_type == 'slow':
+            # Clock 1: Slower, more controllable movement
+            self.current_movement_speed = self.original_movement_speed * 0.5  # 50% slower
+            self.current_acceleration = self.original_acceleration * 0.4  # 60% less acceleration
+            self.modified_physics_type = 'slow'
+        elif clock_type == 'fast':
+            # Clock 2: Faster, chaotic movement
+            self.current_movement_speed = self.original_movement_speed * 1.8  # 80% faster
+            self.current_acceleration = self.original_acceleration * 2.5  # 150% more acceleration
+            self.modified_physics_type = 'fast'
+
+        self.physics_modified = True
+
+    def reset_physics(self):
+        """Reset physics to normal values"""
+        self.current_movement_speed = self.original_movement_speed
+        self.current_acceleration = self.original_acceleration
+        self.physics_modified = False
+        self.pending_physics_reset = False
+        self.modified_physics_type = None
+
+    def is_player_grounded(self):
+        """Check if player is on ground (top or bottom)"""
+        return (self.player_pos[1] == self.ground_y or
+                self.player_pos[1] == self.ceiling_y) and not self.is_moving_up and not self.is_moving_down
+
+    def spawn_clock_powerup(self):
+        """Spawn Clock 1 (good) powerup"""
+        if not self.entities.count(self.uhr_kind) and self.clock_spawn_cooldown <= 0:
+            # Choose random position (top or bottom)
+            potential_pos = [WIDTH, self.rng.choice([60, HEIGHT - self.uhr_size - 60])]
+
+            if not self.clock_spawn_conflict(potential_pos):
+                self.entities.add(self.uhr_kind, *potential_pos)
+                self.clock_spawn_cooldown = 60  # 1 second cooldown between clock spawns
+
+        self.spawn_timer_uhr = 0
+        # Set next spawn interval (30-60 seconds)
+        self.spawn_interval_uhr = self.rng.randint(30 * FPS, 60 * FPS)
+
+    def spawn_clock2_powerup(self):
+        """Spawn Clock 2 (bad) powerup"""
+        if not self.entities.count(self.uhr2_kind) and self.clock_spawn_cooldown <= 0:
+            # Choose random position (top or bottom)
+            potential_pos = [WIDTH, self.rng.choice([60, HEIGHT - self.uhr2_size - 60])]
+
+            if not self.clock_spawn_conflict(potential_pos):
+                self.entities.add(self.uhr2_kind, *potential_pos)
+                self.clock_spawn_cooldown = 60  # 1 second cooldown between clock spawns
+
+        self.spawn_timer_uhr2 = 0
+        # Set next spawn interval (30-60 seconds)
+        self.spawn_interval_uhr2 = self.rng.randint(30 * FPS, 60 * FPS)
+
+    def clock_spawn_conflict(self, potential_pos):
+        """Check for conflicts with spikes"""
+        entities = self.entities
+        for i in entities.scan_back(potential_pos[0] - 200):
+            if (entities.kind[i] in self.spike_kinds and
+                    abs(entities.x[i] - potential_pos[0]) < 200 and
+                    abs(entities.y[i] - potential_pos[1]) < 100):
+                return True
+        return False
+
+    def update_clock_spawns(self):
+        """Update clock spawn timers and spawn clocks"""
+        # Decrease spawn cooldown
+        if self.clock_spawn_cooldown > 0:
+            self.clock_spawn_cooldown -= 1
+
+        # Update spawn timers and spawn clocks
+        self.spawn_timer_uhr += 1
+        self.spawn_timer_uhr2 += 1
+
+        # Spawn Clock 1 (good)
+        if self.spawn_timer_uhr >= self.spawn_interval_uhr:
+            self.spawn_clock_powerup()
+
+        # Spawn Clock 2 (bad)
+        if self.spawn_timer_uhr2 >= self.spawn_interval_uhr2:
+            self.spawn_clock2_powerup()
+
+    def collect_clock(self, index):
+        """Clock 1 (good) collected: slow time"""
+        self.entities.remove(index)
+        self.clock_active = True
+        self.clock_timer = self.clock_duration
+        self.apply_clock_physics('slow')
+        if self.on_sound:
+            self.on_sound('clock')
+        return True  # Only one clock effect at a time
+
+    def collect_clock2(self, index):
+        """Clock 2 (bad) collected: fast time"""
+        self.entities.remove(index)
+        self.clock2_active = True
+        self.clock2_timer = self.clock_duration
+        self.apply_clock_physics('fast')
+        if self.on_sound:
+            self.on_sound('clock2')
+        return True  # Only one clock effect at a time
+
+    def update_clock_effects(self):
+        """Collect clocks and update active clock effects"""
+        # Check collision with clocks (only while no effect is active)
+        if not self.clock_active and not self.clock2_active:
+            self.entities.collide(self.player_pos[0], self.player_pos[1], self.clock_kinds)
+
+        # Update Clock 1 timer
+        if self.clock_active:
+            self.clock_timer -= 1 / FPS
+            if self.clock_timer <= 0:
+                self.clock_active = False
+                if self.is_player_grounded():
+                    self.reset_physics()
+                else:
+                    self.pending_physics_reset = True
+
+        # Update Clock 2 timer
+        if self.clock2_active:
+            self.clock2_timer -= 1 / FPS
+            if self.clock2_timer <= 0:
+                self.clock2_active = False
+                if self.is_player_grounded():
+                    self.reset_physics()
+                else:
+                    self.pending_physics_reset = True
+
+        # Check for physics reset when landing
+        if self.pending_physics_reset and self.is_player_grounded():
+            self.reset_physics()
+
+    # ===== SPIELFIGUR =====
+
+    def handle_jump_input(self):
+        """Handle jump input with modified physics"""
+        self.input_log.append(self.frame)
+        jumps = self.jumps
+
+        # Sprung von unten nach oben
+        if self.player_pos[1] == self.ground_y and not self.is_moving_up and not self.is_moving_down:
+            self.is_moving_up = True
+            self.destination_pos = self.ceiling_y
+            self.player_up = True
+            self.air_jump_used = False
+            self.jumps += 1
+            self.game_speed += JUMP_SPEEDUP
+            self.movement_speed = self.current_movement_speed  # Use modified speed
+
+        # Sprung von oben nach unten
+        elif self.player_pos[1] == self.ceiling_y and not self.is_moving_up and not self.is_moving_down:
+            self.is_moving_down = True
+            self.destination_pos = self.ground_y
+            self.player_up = False
+            self.air_jump_used = False
+            self.jumps += 1
+            self.game_speed += JUMP_SPEEDUP
+            self.movement_speed = self.current_movement_speed  # Use modified speed
+
+        # Richtungswechsel während Aufwärtsbewegung (in der Luft) - nur einmal
+        elif self.is_moving_up and not self.air_jump_used:
+            self.is_moving_up = False
+            self.is_moving_down = True
+            self.destination_pos = self.ground_y
+            self.player_up = False
+            self.movement_speed = self.current_movement_speed * 1.2  # Slightly faster for air control
+            self.air_jump_used = True
+            self.jumps += 1
+            self.game_speed += JUMP_SPEEDUP
+
+        # Richtungswechsel während Abwärtsbewegung (in der Luft) - nur einmal
+        elif self.is_moving_down and not self.air_jump_used:
+            self.is_moving_down = False
+            self.is_moving_up = True
+            self.destination_pos = self.ceiling_y
+            self.player_up = True
+            self.movement_speed = self.current_movement_speed * 1.2  # Slightly faster for air control
+            self.air_jump_used = True
+            self.jumps += 1
+            self.game_speed += JUMP_SPEEDUP
+
+        if self.on_sound and self.jumps != jumps:
+            self.on_sound('jump')
+
+    def update_player_movement(self):
+        """Update player movement with modified physics"""
+        # Bewegung der Spielfigur with current acceleration
+        if self.is_moving_up:
+            self.player_pos[1] -= self.movement_speed
+            self.movement_speed += self.current_acceleration  # Use modified acceleration
+            if self.player_pos[1] <= self.destination_pos:
+                self.player_pos[1] = self.destination_pos
+                self.is_moving_up = False
+                self.air_jump_used = False
+                self.movement_speed = self.current_movement_speed
+        elif self.is_moving_down:
+            self.player_pos[1] += self.movement_speed
+            self.movement_speed += self.current_acceleration  # Use modified acceleration
+            if self.player_pos[1] >= self.destination_pos:
+                self.player_pos[1] = self.destination_pos
+                self.is_moving_down = False
+                self.air_jump_used = False
+                self.movement_speed = self.current_movement_speed
+
+    # ===== SPIKES =====
+
+    def get_difficulty_factor(self):
+        """Berechnet Schwierigkeitsfaktor basierend auf gesammelten Münzen"""
+        return min(self.coins_collected / 10.0, 1.0)  # Max Schwierigkeit bei 10 Münzen
+
+    def choose_spike_pattern(self):
+        """Wählt ein intelligentes Spike-Muster basierend auf Schwierigkeit und letzten Mustern"""
+        difficulty = self.get_difficulty_factor()
+
+        # Verhindere zu viele aufeinanderfolgende Spikes an gleicher Position
+        if self.consecutive_same_position >= 3:
+            available_patterns = ["alternating", "safe_zone", "double_gap"]
+        else:
+            available_patterns = self.spike_patterns.copy()
+
+        # Schwierigkeitsbasierte Musterauswahl
+        if difficulty < 0.3:  # Anfänger
+            available_patterns = ["single_top", "single_bottom", "safe_zone", "gap_top", "gap_bottom"]
+        elif difficulty < 0.6:  # Mittel
+            available_patterns = ["single_top", "single_bottom", "alternating", "gap_top", "gap_bottom",
+                                  "double_gap"]
+        # Schwer: Alle Muster verfügbar
+
+        self.current_pattern = self.rng.choice(available_patterns)
+        self.pattern_progress = 0
+
+        # Musterlänge festlegen
+        if self.current_pattern == "safe_zone":
+            self.pattern_length = self.rng.randint(2, 4)
+        elif self.current_pattern == "alternating":
+            self.pattern_length = self.rng.randint(3, 6)
+        elif self.current_pattern == "double_gap":
+            self.pattern_length = 4
+        else:
+            self.pattern_length = self.rng.randint(1, 3)
+
+    def add_spike(self, x, top):
+        """Neuen Spike oben (an der Decke) oder unten (am Boden) einfügen"""
+        if top:
+            self.entities.add(self.spike_top_kind, x, 40)
+        else:
+            self.entities.add(self.spike_kind, x, HEIGHT - self.spike_size - 34)
+
+    def spawn_spike_with_pattern(self):
+        """Spawnt Spikes basierend auf dem aktuellen Muster"""
+        pattern = self.current_pattern
+
+        if pattern == "safe_zone":
+            # Keine Spikes spawnen
+            return
+
+        elif pattern == "single_top":
+            self.add_spike(WIDTH, True)
+            self.track_spike_position("top")
+
+        elif pattern == "single_bottom":
+            self.add_spike(WIDTH, False)
+            self.track_spike_position("bottom")
+
+        elif pattern == "alternating":
+            if self.pattern_progress % 2 == 0:
+                self.add_spike(WIDTH, True)
+                self.track_spike_position("top")
+            else:
+                self.add_spike(WIDTH, False)
+                self.track_spike_position("bottom")
+
+        elif pattern == "gap_top":
+            # Spike unten, Lücke oben
+            self.add_spike(WIDTH, False)
+            self.track_spike_position("bottom")
+
+        elif pattern == "gap_bottom":
+            # Spike oben, Lücke unten
+            self.add_spike(WIDTH, True)
+            self.track_spike_position("top")
+
+        elif pattern == "double_gap":
+            if self.pattern_progress == 0 or self.pattern_progress == 3:
+                # Beide Positionen blockiert - Spieler muss springen
+                self.add_spike(WIDTH, True)
+                self.add_spike(WIDTH + self.spike_spread, False)
+            elif self.pattern_progress == 1:
+                # Nur oben
+                self.add_spike(WIDTH, True)
+            else:  # pattern_progress == 2
+                # Nur unten
+                self.add_spike(WIDTH, False)
+
+    def track_spike_position(self, position):
+        """Verfolgt Spike-Positionen für intelligenteres Spawning"""
+        self.last_spike_positions.append(position)
+        if len(self.last_spike_positions) > 5:
+            self.last_spike_positions.pop(0)
+
+        # Zähle aufeinanderfolgende gleiche Positionen
+        if len(self.last_spike_positions) >= 2 and self.last_spike_positions[-1] == self.last_spike_positions[-2]:
+            self.consecutive_same_position += 1
+        else:
+            self.consecutive_same_position = 0
+
+    def spawn_spikes(self):
+        """Spike-Spawn nach Muster"""
+        # Verbessertes Spike-Spawn-System
+        if self.spawn_timer_spike >= self.spawn_interval_spike:
+            # Neues Muster wählen wenn aktuelles beendet ist
+            if self.current_pattern is None or self.pattern_progress >= self.pattern_length:
+                self.choose_spike_pattern()
+
+            # Spike mit aktuellem Muster spawnen
+            self.spawn_spike_with_pattern()
+            self.pattern_progress += 1
+
+            self.spawn_timer_spike = 0
+        self.spawn_timer_spike += 1
+
+    def hit_spike(self, index):
+        """Spike berührt: Runde endet nach dem Kollisionsdurchlauf"""
+        self.spike_hit = True
+
+    # ===== MÜNZE =====
+
+    def spawn_coin(self):
+        """Münz-Spawn (vor der Bewegung in diesem Frame)"""
+        coin_size = self.coin_size
+        spike_size = self.spike_size
+
+        if self.spawn_timer_coin >= self.spawn_interval_coin and not self.entities.count(self.coin_kind):
+            potential_coin_pos = [WIDTH, self.rng.choice([40, HEIGHT - coin_size - 40])]
+            # Spikes an ihrer Position nach der Bewegung in diesem Frame prüfen
+            entities = self.entities
+            speed = self.game_speed
+            if not any(
+                    entities.kind[i] in self.spike_kinds and
+                    entities.x[i] - speed < potential_coin_pos[0] + coin_size and
+                    entities.x[i] - speed + spike_size > potential_coin_pos[0] and
+                    entities.y[i] == potential_coin_pos[1]
+                    for i in entities.scan_back(potential_coin_pos[0] - spike_size)
+            ):
+                entities.add(self.coin_kind, *potential_coin_pos)
+            self.spawn_timer_coin = 0
+        self.spawn_timer_coin += 1
+
+    def collect_coin(self, index):
+        """Münze eingesammelt"""
+        self.entities.remove(index)
+        self.coins_collected += 1
+        self.game_speed += 0.1
+        self.spawn_interval_coin = max(50, self.spawn_interval_coin - 10)
+        self.spawn_interval_spike = max(80, self.spawn_interval_spike - 20)
+        if self.on_sound:
+            self.on_sound('coin')
+
+    # ===== KOLLISION =====
+
+    def check_spike_collision(self):
+        """Überprüfung: Kollision zwischen Spike und Spieler"""
+        return bool(self.entities.hits(self.player_pos[0], self.player_pos[1], self.spike_kinds))
+
+    def die(self, cause):
+        """Runde beenden und Score festhalten"""
+        self.score = calculate_score(self.coins_collected, self.timer, self.jumps)
+        self.death_cause = cause
+        self.game_over = True
+        self.game_speed = 0
+        self.movement_speed = 1
+        if self.on_sound:
+            self.on_sound('death')
+
+    # ===== FRAME =====
+
+    def update(self):
+        """Simuliert einen Frame Spiellogik (ohne Eingabe)"""
+        if self.game_over:
+            return
+
+        # Spawnen (Zufallszahlen in dieser Reihenfolge: Uhren, Spikes, Münze)
+        self.update_clock_spawns()
+        self.spawn_spikes()
+        self.spawn_coin()
+
+        # Alle Pickups und Hindernisse gemeinsam bewegen und aussortieren
+        self.entities.move(self.game_speed)
+
+        # Uhren einsammeln und Effekte ablaufen lassen
+        self.update_clock_effects()
+
+        # Update player movement with modified physics
+        self.update_player_movement()
+
+        # Münze einsammeln, Spikes prüfen
+        self.entities.collide(self.player_pos[0], self.player_pos[1], self.contact_kinds)
+        if self.spike_hit:
+            self.die('spike')
+            return
+
+        # Timer aktualisieren
+        self.timer += 1 / FPS
+        self.game_speed += FRAME_SPEEDUP
+        self.frame += 1
+
+    def step(self, action=False):
+        """Ein Frame mit optionalem Sprung (SPACE); gibt den neuen Zustand zurück"""
+        if action and not self.game_over:
+            self.handle_jump_input()
+        self.update()
+        return self.state()
+
+    def state(self):
+        """Momentaufnahme des Spielzustands als Dictionary (für Bots)"""
+        return {
+            'frame': self.frame,
+            'player_pos': (self.player_pos[0], self.player_pos[1]),
+            'is_moving_up': self.is_moving_up,
+            'is_moving_down': self.is_moving_down,
+            'air_jump_used': self.air_jump_used,
+            'movement_speed': self.movement_speed,
+            'game_speed': self.game_speed,
+            'spikes': self.entities.positions(self.spike_kinds),
+            'coin': self.entities.first(self.coin_kind),
+            'uhr': self.entities.first(self.uhr_kind),
+            'uhr2': self.entities.first(self.uhr2_kind),
+            'clock_active': self.clock_active,
+            'clock2_active': self.clock2_active,
+            'physics': self.modified_physics_type or 'normal',
+            'timer': self.timer,
+            'coins': self.coins_collected,
+            'jumps': self.jumps,
+            'game_over': self.game_over,
+            'death_cause': self.death_cause,
+            'score': self.score,
+        }
+
+
+def run_benchmark(frames, jump_chance):
+    """Simuliert headless so schnell wie möglich und misst den Durchsatz"""
+    game = Game()
+    games = 1
+    start = time.perf_counter()
+    for _ in range(frames):
+        game.step(random.random() < jump_chance)
+        if game.game_over:
+            game.reset()
+            games += 1
+    elapsed = time.perf_counter() - start
+
+    fps = frames / elapsed
+    print(f"{frames} Frames in {elapsed:.2f}s ({games} Spiele)")
+    print(f"{fps:.0f} Frames/s = {fps / FPS:.0f}x Echtzeit")
+
+
+def _rect_spike_collision(game):
+    """Bisherige Kollisionsprüfung mit einem pygame.Rect pro Spike (Referenz)"""
+    player_size = game.player_size
+    spike_size = game.spike_size
+    player_hitbox = pygame.Rect(
+        game.player_pos[0] + player_size[0] * 0.1,
+        game.player_pos[1] + player_size[1] * 0.1,
+        player_size[0] * 0.8,
+        player_size[1] * 0.8,
+    )
+    for spike_x, spike_y in game.entities.positions(game.spike_kinds):
+        spike_hitbox = pygame.Rect(
+            spike_x + spike_size * 0.1,
+            spike_y + spike_size * 0.1,
+            spike_size * 0.8,
+            spike_size * 0.8,
+        )
+        if player_hitbox.colliderect(spike_hitbox):
+            return True
+    return False
+
+
+def run_collision_benchmark(counts=(4, 16, 64, 256, 1024), repeats=2000):
+    """Kollisionsprüfung mit wachsender Spike-Zahl, gegen die Rect-Variante gemessen
+
+    Die Spikes liegen abwechselnd oben und unten von knapp hinter der
+    Spielfigur bis weit rechts außerhalb des Bildschirms. Vor der Messung
+    wird für viele Spielerhöhen geprüft, dass beide Varianten übereinstimmen.
+    """
+    game = Game(seed=0)
+    print(f"{'Spikes':>7} {'Fenster µs':>11} {'Rect µs':>9}")
+    for count in counts:
+        game.entities.clear()
+        for i in range(count):
+            game.add_spike(-game.spike_size + i * 23.7, i % 2 == 0)
+
+        for y in range(game.ceiling_y, game.ground_y + 1, 3):
+            for x in (-20, 0, 20, 50, 80):
+                game.player_pos = [x, y]
+                assert game.check_spike_collision() == _rect_spike_collision(game), (count, x, y)
+        game.player_pos = [50, (game.ceiling_y + game.ground_y) // 2]
+
+        timings = []
+        for check in (game.check_spike_collision, lambda: _rect_spike_collision(game)):
+            start = time.perf_counter()
+            for _ in range(repeats):
+                check()
+            timings.append((time.perf_counter() - start) / repeats * 1e6)
+        print(f"{count:>7} {timings[0]:>11.2f} {timings[1]:>9.2f}")
+
+
+if __name__ == '__main__':
+    enable_headless()
+    if len(sys.argv) > 1 and sys.argv[1] == 'collision':
+        run_collision_benchmark()
+    else:
+        bench_frames = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+        run_benchmark(bench_frames, 0.02)
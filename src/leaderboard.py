@@ -0,0 +1,214 @@
+import heapq
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    coins INTEGER NOT NULL,
+    time REAL NOT NULL,
+    jumps INTEGER NOT NULL,
+    date TEXT NOT NULL,
+    replay TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_name_score ON runs (name, score DESC);
+
+-- Bester Lauf je Spieler, beim Einfügen aktualisiert
+CREATE TABLE IF NOT EXISTS best (
+    name TEXT PRIMARY KEY,
+    score INTEGER NOT NULL,
+    run_id INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS best_score ON best (score DESC, run_id);
+"""
+
+# Bei gleichem Score steht der frühere Lauf vorne (wie das stabile Sortieren bisher)
+TOP_PLAYERS = """
+SELECT runs.name, runs.score, runs.coins, runs.time, runs.jumps, runs.date
+FROM best JOIN runs ON runs.id = best.run_id
+ORDER BY best.score DESC, best.run_id
+LIMIT ?
+"""
+
+UPDATE_BEST = """
+INSERT INTO best (name, score, run_id) VALUES (?, ?, ?)
+ON CONFLICT (name) DO UPDATE SET score = excluded.score, run_id = excluded.run_id
+WHERE excluded.score > best.score
+"""
+
+
+class Leaderboard:
+    """Lokale Rangliste in SQLite: jeder Lauf wird gespeichert
+
+    Die Tabelle best hält den besten Lauf je Spieler und wird beim Einfügen
+    per Upsert nachgeführt. "Top 10 verschiedener Spieler" ist damit ein
+    Indexscan über best_score und "persönlicher Rekord" ein Zugriff über den
+    Primärschlüssel, egal wie viele Läufe gespeichert sind.
+    """
+
+    def __init__(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(path)
+        self.connection.execute('PRAGMA journal_mode = WAL')
+        self.connection.execute('PRAGMA synchronous = NORMAL')
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def add_run(self, name, score, coins, time_survived, jumps, date=None, replay=None):
+        """Lauf speichern; gibt seine id zurück"""
+        with self.connection:
+            return self._insert(name, score, coins, time_survived, jumps, date, replay)
+
+    def add_runs(self, runs):
+        """Viele Läufe (Tupel wie bei add_run) in einer Transaktion speichern"""
+        with self.connection:
+            for run in runs:
+                self._insert(*run)
+
+    def _insert(self, name, score, coins, time_survived, jumps, date=None, replay=None):
+        date = date or datetime.now().strftime('%Y-%m-%d %H:%M')
+        cursor = self.connection.execute(
+            'INSERT INTO runs (name, score, coins, time, jumps, date, replay) VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (name, score, coins, time_survived, jumps, date, replay),
+        )
+        run_id = cursor.lastrowid
+        self.connection.execute(UPDATE_BEST, (name, score, run_id))
+        return run_id
+
+    def top_players(self, limit=10):
+        """Bester Lauf der limit besten Spieler, als Dicts wie in den globalen Rankings"""
+        rows = self.connection.execute(TOP_PLAYERS, (limit,)).fetchall()
+        return [
+            {'name': name, 'score': score, 'coins': coins, 'time': time_survived, 'jumps': jumps, 'date': date}
+            for name, score, coins, time_survived, jumps, date in rows
+        ]
+
+    def personal_best(self, name, before_run=None):
+        """Bester Score des Spielers, mit before_run nur aus früheren Läufen (0 ohne Lauf)"""
+        if before_run is None:
+            row = self.connection.execute('SELECT score FROM best WHERE name = ?', (name,)).fetchone()
+        else:
+            # Index runs_name_score liefert die Läufe absteigend; meist passt der erste
+            row = self.connection.execute(
+                'SELECT score FROM runs WHERE name = ? AND id < ? ORDER BY score DESC LIMIT 1',
+                (name, before_run),
+            ).fetchone()
+        return row[0] if row else 0
+
+    def run_count(self):
+        return self.connection.execute('SELECT COUNT(*) FROM runs').fetchone()[0]
+
+
+class TopPlayers:
+    """Bester Eintrag der k besten Spieler, Ergebnis für Ergebnis nachgeführt
+
+    best hält den besten Eintrag jedes bekannten Spielers, heap die k besten
+    Spieler als Min-Heap (score, -Reihenfolge, name): oben liegt der
+    schwächste, den ein neues Ergebnis verdrängen muss. add() kostet damit
+    O(log k) statt Gruppieren und Sortieren aller Einträge. Verbessert sich
+    ein Spieler, der schon in den Top k ist, bleibt sein alter Heap-Eintrag
+    liegen und wird beim nächsten Blick auf den Heap verworfen. Bei gleichem
+    Score steht der früher eingefügte Eintrag vorne.
+    """
+
+    def __init__(self, k=10):
+        self.k = k
+        self.best = {}  # name -> bester Eintrag
+        self.heap = []
+        self.keys = {}  # name -> aktueller Heap-Schlüssel der Spieler in den Top k
+        self.count = 0
+        self._top = None
+
+    def add(self, entry):
+        """Ein Ergebnis (Dict mit name und score) einfügen; True, wenn sich die Top k geändert haben"""
+        name, score = entry['name'], entry['score']
+        current = self.best.get(name)
+        if current is not None and score <= current['score']:
+            return False
+        self.best[name] = entry
+        self.count += 1
+        key = (score, -self.count, name)
+
+        if name in self.keys or len(self.keys) < self.k:
+            self.keys[name] = key
+            heapq.heappush(self.heap, key)
+            if len(self.heap) > 2 * self.k:
+                self.heap = list(self.keys.values())
+                heapq.heapify(self.heap)
+        else:
+            self._drop_stale()
+            if key < self.heap[0]:
+                return False
+            evicted = heapq.heapreplace(self.heap, key)
+            del self.keys[evicted[2]]
+            self.keys[name] = key
+        self._top = None
+        return True
+
+    def merge(self, entries):
+        """Einträge eines entfernten Stands übernehmen; nur Verbesserungen kosten etwas"""
+        changed = False
+        for entry in entries:
+            changed = self.add(entry) or changed
+        return changed
+
+    def _drop_stale(self):
+        heap, keys = self.heap, self.keys
+        while heap and keys.get(heap[0][2]) != heap[0]:
+            heapq.heappop(heap)
+
+    def top(self):
+        """Einträge der Top k, bester zuerst"""
+        if self._top is None:
+            self._top = [self.best[name] for _, _, name in sorted(self.keys.values(), reverse=True)]
+        return self._top
+
+
+def run_benchmark(runs, players):
+    """Füllt eine temporäre Datenbank und misst Top-10- und Rekord-Abfragen"""
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as directory:
+        leaderboard = Leaderboard(os.path.join(directory, 'leaderboard.db'))
+        start = time.perf_counter()
+        leaderboard.add_runs(
+            (f"SPIELER{rng.randrange(players)}", rng.randrange(5000), rng.randrange(100),
+             rng.random() * 300, rng.randrange(200), '2025-01-01 12:00')
+            for _ in range(runs)
+        )
+        print(f"{runs} Läufe von {players} Spielern eingefügt in {time.perf_counter() - start:.1f}s")
+
+        for label, query in (
+                ("Top 10", lambda: leaderboard.top_players(10)),
+                ("Persönlicher Rekord", lambda: leaderboard.personal_best('SPIELER42')),
+        ):
+            repeats = 1000
+            start = time.perf_counter()
+            for _ in range(repeats):
+                query()
+            print(f"{label}: {(time.perf_counter() - start) / repeats * 1e3:.3f} ms")
+        leaderboard.close()
+
+    # Dieselben Läufe im Speicher: Top 100 über TopPlayers
+    rng = random.Random(0)
+    board = TopPlayers(100)
+    start = time.perf_counter()
+    for _ in range(runs):
+        board.add({'name': f"SPIELER{rng.randrange(players)}", 'score': rng.randrange(5000)})
+    print(f"TopPlayers(100).add: {(time.perf_counter() - start) / runs * 1e6:.2f} µs pro Lauf")
+
+
+if __name__ == '__main__':
+    bench_runs = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    bench_players = int(sys.argv[2]) if len(sys.argv) > 2 else 50000
+    run_benchmark(bench_runs, bench_players)
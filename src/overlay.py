@@ -0,0 +1,65 @@
+import pygame
+
+
+def make_tint(size, color, alpha):
+    """Einfarbige, halbtransparente Fläche (einmal erzeugt, jeden Frame nur geblittet)"""
+    surface = pygame.Surface(size)
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert()
+    surface.fill(color)
+    surface.set_alpha(alpha)
+    return surface
+
+
+class TintCache:
+    """Tönungen in Fenstergröße, erzeugt erst beim ersten Gebrauch
+
+    Jede Fläche kostet beim Anlegen einige Millisekunden; Death Screen und
+    Uhr-Tönungen braucht der erste Frame nicht.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.surfaces = {}
+
+    def get(self, color, alpha):
+        surface = self.surfaces.get((color, alpha))
+        if surface is None:
+            surface = self.surfaces[(color, alpha)] = make_tint(self.size, color, alpha)
+        return surface
+
+
+class RetainedLayer:
+    """Fertig zusammengesetzte Bildschirmebene, neu gezeichnet nur bei geändertem Inhalt
+
+    draw(surface) zeichnet die komplette Ebene. get(key) liefert die Surface
+    und ruft draw nur auf, wenn sich key seit dem letzten Aufruf geändert hat;
+    key fasst dazu alle angezeigten Werte zusammen. Die Surface (mit alpha
+    halbtransparent) entsteht beim ersten get().
+    """
+
+    def __init__(self, size, draw, alpha=None):
+        self.size = size
+        self.alpha = alpha
+        self.surface = None
+        self.draw = draw
+        self.key = None
+        self.valid = False
+        self.changed = False  # Beim letzten get() neu gezeichnet
+
+    def get(self, key):
+        if self.surface is None:
+            self.surface = pygame.Surface(self.size)
+            if pygame.display.get_surface() is not None:
+                self.surface = self.surface.convert()
+            if self.alpha is not None:
+                self.surface.set_alpha(self.alpha)
+        self.changed = not self.valid or key != self.key
+        if self.changed:
+            self.draw(self.surface)
+            self.key = key
+            self.valid = True
+        return self.surface
+
+    def invalidate(self):
+        self.valid = False
@@ -0,0 +1,257 @@
+import csv
+import json
+import math
+import time
+from collections import deque
+
+from stats import percentile
+
+# Histogramm über die ganze Sitzung: logarithmische Eimer ab 1 µs, je 5 % breiter
+BUCKET_MIN_MS = 0.001
+BUCKET_GROWTH = 1.05
+
+# Spiel-Phasen in Game.update(), die install() einzeln misst
+GAME_PHASES = [
+    ('update_clock_spawns', 'clock_spawn'),
+    ('update_clock_effects', 'clock_effects'),
+    ('spawn_spikes', 'spike_spawn'),
+    ('spawn_coin', 'coin_spawn'),
+    ('update_player_movement', 'player'),
+]
+
+
+def bucket_index(ms):
+    if ms <= BUCKET_MIN_MS:
+        return 0
+    return int(math.log(ms / BUCKET_MIN_MS) / math.log(BUCKET_GROWTH)) + 1
+
+
+def bucket_upper_ms(index):
+    return BUCKET_MIN_MS * BUCKET_GROWTH ** index
+
+
+def histogram_percentile(counts, p):
+    """Perzentil (Obergrenze des Eimers) aus einem Histogramm {Eimer: Anzahl}"""
+    total = sum(counts.values())
+    if not total:
+        return 0
+    rank = max(p / 100 * total, 1)
+    seen = 0
+    for index in sorted(counts):
+        seen += counts[index]
+        if seen >= rank:
+            return bucket_upper_ms(index)
+    return bucket_upper_ms(max(counts))
+
+
+class FrameProfiler:
+    """Opt-in Zeitmessung: wohin geht die Zeit eines Frames?
+
+    phase(name) schaltet auf die nächste Phase um; die Zeit seit dem letzten
+    Umschalten zählt zur vorherigen. Verschachtelte Phasen (install()
+    umhüllt Methoden von Game und EntityTable) werden exklusiv gezählt.
+    end_frame() schreibt die Summen des Frames in ein rollendes Fenster
+    (für p50/p99 im Overlay) und in ein Histogramm über die ganze Sitzung
+    (für den Export). Mit enabled=False kosten alle Aufrufe fast nichts und
+    Game bleibt unverändert.
+    """
+
+    def __init__(self, enabled=True, history=600):
+        self.enabled = enabled
+        self.history = history
+        self.phases = []  # Reihenfolge des ersten Auftretens
+        self.window = {}  # Phase -> deque der letzten Frames (ms)
+        self.histograms = {}  # Phase -> {Eimer: Anzahl}
+        self.totals = {}  # Phase -> Summe ms über die Sitzung
+        self.maxima = {}
+        self.frames = 0
+
+        self.frame = {}  # Laufendes Frame: Phase -> Sekunden
+        self.current = 'startup'
+        self.last = self.frame_start = time.perf_counter()
+
+    def phase(self, name):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.frame[self.current] = self.frame.get(self.current, 0.0) + now - self.last
+        self.last = now
+        self.current = name
+
+    def wrap(self, owner, method, name):
+        """owner.method so ersetzen, dass ihre Laufzeit zur Phase name zählt"""
+        function = getattr(owner, method)
+
+        def timed(*args, **kwargs):
+            outer = self.current
+            self.phase(name)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.phase(outer)
+
+        setattr(owner, method, timed)
+
+    def install(self, game):
+        """Spiel-Phasen von game einzeln messen (Instanz-Attribute, Klasse bleibt unverändert)"""
+        if not self.enabled:
+            return
+        for method, name in GAME_PHASES:
+            self.wrap(game, method, name)
+        self.wrap(game.entities, 'move', 'entity_move')
+        self.wrap(game.entities, 'collide', 'collision')
+
+    def end_frame(self):
+        """Frame abschließen; die Gesamtzeit läuft unter 'frame'"""
+        if not self.enabled:
+            return
+        self.phase(self.current)
+        now = time.perf_counter()
+        self.frame['frame'] = now - self.frame_start
+        self.frame_start = now
+
+        for name, seconds in self.frame.items():
+            if name not in self.window:
+                self.phases.append(name)
+                self.window[name] = deque(maxlen=self.history)
+                self.histograms[name] = {}
+                self.totals[name] = 0.0
+                self.maxima[name] = 0.0
+            ms = seconds * 1000
+            self.window[name].append(ms)
+            histogram = self.histograms[name]
+            index = bucket_index(ms)
+            histogram[index] = histogram.get(index, 0) + 1
+            self.totals[name] += ms
+            self.maxima[name] = max(self.maxima[name], ms)
+        # Phasen ohne Zeit in diesem Frame zählen mit 0
+        for name in self.phases:
+            if name not in self.frame:
+                self.window[name].append(0.0)
+        self.frames += 1
+        self.frame = {}
+
+    def recent(self, name):
+        """(p50, p99) in ms über das rollende Fenster"""
+        values = sorted(self.window.get(name, ()))
+        return percentile(values, 50), percentile(values, 99)
+
+    def summary(self):
+        """Kennzahlen je Phase über die ganze Sitzung (ms, p-Werte auf 5 % genau)"""
+        rows = []
+        for name in self.phases:
+            counts = self.histograms[name]
+            samples = sum(counts.values())
+            rows.append({
+                'phase': name,
+                'samples': samples,
+                'mean_ms': self.totals[name] / samples if samples else 0,
+                'p50_ms': histogram_percentile(counts, 50),
+                'p90_ms': histogram_percentile(counts, 90),
+                'p99_ms': histogram_percentile(counts, 99),
+                'max_ms': self.maxima[name],
+            })
+        return rows
+
+    def export(self, path):
+        """Zusammenfassung als CSV (eine Zeile je Phase) oder JSON (zusätzlich die Histogramme)"""
+        rows = self.summary()
+        if path.endswith('.csv'):
+            with open(path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=list(rows[0]) if rows else ['phase'])
+                writer.writeheader()
+                writer.writerows(rows)
+        else:
+            histograms = {
+                name: {f"{bucket_upper_ms(index):.4f}": count for index, count in sorted(counts.items())}
+                for name, counts in self.histograms.items()
+            }
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({'frames': self.frames, 'phases': rows, 'histograms_ms': histograms}, f, indent=2)
+
+
+class StartupTimer:
+    """Zeit vom Programmstart bis zum ersten Frame, in Abschnitte aufgeteilt
+
+    mark(name) schließt den Abschnitt seit der letzten Marke ab. Der Start
+    des Interpreters selbst (vor der ersten Zeile von main.py) fehlt.
+    """
+
+    def __init__(self, start=None):
+        self.start = self.last = time.perf_counter() if start is None else start
+        self.sections = []  # (Name, ms)
+
+    def mark(self, name):
+        now = time.perf_counter()
+        self.sections.append((name, (now - self.last) * 1000))
+        self.last = now
+
+    def total_ms(self):
+        return (self.last - self.start) * 1000
+
+    def report(self):
+        lines = [f"{name:>12}: {ms:7.1f} ms" for name, ms in self.sections]
+        lines.append(f"{'gesamt':>12}: {self.total_ms():7.1f} ms bis zum ersten Frame")
+        return '\n'.join(lines)
+
+
+class InputLatency:
+    """Latenz vom Sprung-Tastendruck bis zum Physikschritt und zum angezeigten Frame
+
+    pygame liefert keine Zeitstempel der Tasten-Events; als Zeitpunkt des
+    Drucks gilt der Abruf der Events (poll). Der Druck kann bis zu einem
+    Abstand zweier Abrufe früher passiert sein; 'worst_present_ms' rechnet
+    diesen Abstand mit ein.
+    """
+
+    def __init__(self):
+        self.poll_time = None
+        self.poll_gap = 0.0
+        self.pressed = []  # (Abruf, Abstand zum vorigen Abruf) ohne Physikschritt
+        self.stepped = []  # ... mit Physikschritt, noch nicht angezeigt
+        self.samples = {'physics_ms': [], 'present_ms': [], 'worst_present_ms': []}
+
+    def poll(self, now):
+        if self.poll_time is not None:
+            self.poll_gap = now - self.poll_time
+        self.poll_time = now
+
+    def press(self):
+        self.pressed.append((self.poll_time, self.poll_gap))
+
+    def step(self, now):
+        """Ein Physikschritt hat die bisherigen Drücke verarbeitet"""
+        for polled, gap in self.pressed:
+            self.samples['physics_ms'].append((now - polled) * 1000)
+            self.stepped.append((polled, gap))
+        self.pressed.clear()
+
+    def present(self, now):
+        for polled, gap in self.stepped:
+            self.samples['present_ms'].append((now - polled) * 1000)
+            self.samples['worst_present_ms'].append((now - polled + gap) * 1000)
+        self.stepped.clear()
+
+    def summary(self):
+        rows = {}
+        for name, values in self.samples.items():
+            values = sorted(values)
+            rows[name] = {
+                'count': len(values),
+                'p50': percentile(values, 50),
+                'p99': percentile(values, 99),
+                'max': values[-1] if values else 0,
+            }
+        return rows
+
+    def report(self):
+        labels = {
+            'physics_ms': "Druck -> Physik",
+            'present_ms': "Druck -> Bild",
+            'worst_present_ms': "Druck -> Bild (höchstens)",
+        }
+        lines = []
+        for name, row in self.summary().items():
+            lines.append(f"{labels[name]:>25}: p50 {row['p50']:6.2f} ms  p99 {row['p99']:6.2f} ms  "
+                         f"max {row['max']:6.2f} ms  ({row['count']} Sprünge)")
+        return '\n'.join(lines)
@@ -0,0 +1,138 @@
+import base64
+import sys
+
+from game import Game, enable_headless
+
+# Replay-Format (binär, wenige Bytes pro Sprung):
+#   MAGIC | varint seed | varint Anzahl | varint Frame-Abstände der Leertasten-Drücke
+# Die Drücke stehen aufsteigend als Abstand zum vorherigen Druck, sodass
+# ein Sprung selten mehr als ein Byte braucht.
+MAGIC = b'RIR1'
+
+
+class ReplayError(ValueError):
+    """Replay-Daten sind beschädigt oder haben ein falsches Format"""
+
+
+def _write_varint(out, value):
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return
+
+
+def _read_varint(data, pos):
+    value = 0
+    shift = 0
+    while True:
+        if pos >= len(data):
+            raise ReplayError("Replay endet mitten in einer Zahl")
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+
+
+class Replay:
+    """Seed einer Runde plus die Frames aller Leertasten-Drücke"""
+
+    def __init__(self, seed, presses=()):
+        self.seed = seed
+        self.presses = list(presses)
+
+    @classmethod
+    def from_game(cls, game):
+        """Replay der (laufenden oder beendeten) Runde eines Game"""
+        return cls(game.seed, game.input_log)
+
+    def encode(self):
+        out = bytearray(MAGIC)
+        _write_varint(out, self.seed)
+        _write_varint(out, len(self.presses))
+        previous = 0
+        for frame in self.presses:
+            _write_varint(out, frame - previous)
+            previous = frame
+        return bytes(out)
+
+    @classmethod
+    def decode(cls, data):
+        if data[:len(MAGIC)] != MAGIC:
+            raise ReplayError("Kein Run-It-Replay")
+        seed, pos = _read_varint(data, len(MAGIC))
+        count, pos = _read_varint(data, pos)
+        presses = []
+        frame = 0
+        for _ in range(count):
+            delta, pos = _read_varint(data, pos)
+            frame += delta
+            presses.append(frame)
+        if pos != len(data):
+            raise ReplayError("Unerwartete Daten am Ende des Replays")
+        return cls(seed, presses)
+
+    def to_text(self):
+        """Replay als Base64-Text (z.B. für JSON)"""
+        return base64.b64encode(self.encode()).decode('ascii')
+
+    @classmethod
+    def from_text(cls, text):
+        try:
+            data = base64.b64decode(text, validate=True)
+        except ValueError as e:
+            raise ReplayError(f"Ungültiges Base64: {e}")
+        return cls.decode(data)
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(self.encode())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            return cls.decode(f.read())
+
+
+class ReplayPlayer:
+    """Spielt die Drücke eines Replays Frame für Frame in ein Game ein"""
+
+    def __init__(self, replay):
+        self.replay = replay
+        self.index = 0
+
+    def start(self, game):
+        """Game auf den Seed des Replays zurücksetzen"""
+        game.reset(self.replay.seed)
+        self.index = 0
+
+    def feed(self, game):
+        """Alle Drücke des aktuellen Frames ausführen (vor game.update() aufrufen)"""
+        presses = self.replay.presses
+        while self.index < len(presses) and presses[self.index] <= game.frame:
+            game.handle_jump_input()
+            self.index += 1
+
+
+def simulate(replay, max_frames=None, game=None):
+    """Spielt ein Replay headless so schnell wie möglich ab und gibt das Game zurück"""
+    game = game or Game()
+    player = ReplayPlayer(replay)
+    player.start(game)
+    while not game.game_over and (max_frames is None or game.frame < max_frames):
+        player.feed(game)
+        game.update()
+    return game
+
+
+if __name__ == '__main__':
+    enable_headless()
+    for replay_path in sys.argv[1:]:
+        result = simulate(Replay.load(replay_path))
+        print(f"{replay_path}: Score {result.score} (Coins {result.coins_collected}, "
+              f"Zeit {result.timer:.1f}s, Sprünge {result.jumps}, Frame {result.frame})")
@@ -0,0 +1,67 @@
+import os
+
+import pygame
+
+# Base directory of the script
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ASSETS_DIR = os.path.join(BASE_DIR, '..', 'assets')
+
+# Schlüssel -> (Datei, Skalierung, Transparenz)
+# Der Boden ist komplett deckend und wird deshalb ohne Alphakanal konvertiert.
+SPRITE_FILES = {
+    'boden': ('boden.png', 3, False),
+    'player_down': ('Figur_12x14.png', 4, True),
+    'player_up': ('Figur_12x14_reverse.png', 4, True),
+    'coin': ('Münze 1.png', 3, True),
+    'uhr': ('Uhr.png', 3, True),
+    'uhr2': ('Uhr2.png', 3, True),
+    'spike': ('Spike 16x12.png', 3, True),
+    'spike_reverse': ('Spike 16x12_reverse.png', 3, True),
+}
+
+# Abgeleitete Varianten: Schlüssel -> (Basis-Schlüssel, horizontal spiegeln, vertikal spiegeln)
+SPRITE_VARIANTS = {
+    'decke': ('boden', False, True),  # Decke = gespiegelter Boden
+}
+
+
+# Hilfsfunktion: Laden und Skalieren eines Bildes
+def load_scaled_image(path, scale):
+    image = pygame.image.load(os.path.join(ASSETS_DIR, 'images', path))
+    return pygame.transform.scale(image, (image.get_width() * scale, image.get_height() * scale))
+
+
+class SpriteAtlas:
+    """Lädt jedes Bild genau einmal und hält fertig skalierte, konvertierte Surfaces
+
+    Gespiegelte Varianten (z.B. die Decke) werden einmal erzeugt und unter
+    eigenem Schlüssel abgelegt, statt pro Frame pygame.transform.flip
+    aufzurufen. Konvertiert wird nur, wenn schon ein Fenster existiert
+    (convert() braucht das Pixelformat des Displays).
+    """
+
+    def __init__(self):
+        self.surfaces = {}
+
+    def __getitem__(self, key):
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = self.surfaces[key] = self._load(key)
+        return surface
+
+    def _load(self, key):
+        if key in SPRITE_VARIANTS:
+            base_key, flip_x, flip_y = SPRITE_VARIANTS[key]
+            return pygame.transform.flip(self[base_key], flip_x, flip_y)
+
+        path, scale, alpha = SPRITE_FILES[key]
+        surface = load_scaled_image(path, scale)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha() if alpha else surface.convert()
+        return surface
+
+    def load_all(self):
+        """Alle Sprites vorab laden (z.B. beim Start statt beim ersten Zeichnen)"""
+        for key in list(SPRITE_FILES) + list(SPRITE_VARIANTS):
+            self[key]
+        return self
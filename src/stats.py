@@ -0,0 +1,32 @@
+import math
+
+
+def percentile(sorted_values, p):
+    """Perzentil (nearest rank) einer sortierten Liste: der Wert an Rang ceil(p/100 * n)"""
+    if not sorted_values:
+        return 0
+    # p * n / 100 statt p / 100 * n: z.B. 0.07 * 100 ergäbe 7.000000000000001 und Rang 8
+    rank = max(math.ceil(p * len(sorted_values) / 100), 1)
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def run_self_check():
+    """Kleine n, bei denen sich nearest rank und Rundung unterscheiden"""
+    cases = [
+        (list(range(1, 3)), 50, 1),
+        (list(range(1, 7)), 50, 3),
+        (list(range(1, 101)), 99, 99),
+        (list(range(1, 101)), 7, 7),
+        (list(range(1, 101)), 100, 100),
+        ([5], 0, 5),
+        ([5], 99, 5),
+        ([], 50, 0),
+    ]
+    for values, p, expected in cases:
+        result = percentile(values, p)
+        assert result == expected, (len(values), p, result, expected)
+    print(f"percentile: {len(cases)} Fälle richtig")
+
+
+if __name__ == '__main__':
+    run_self_check()
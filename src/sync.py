@@ -0,0 +1,313 @@
+import json
+import os
+import queue
+import random
+import threading
+import time
+from datetime import datetime
+
+from leaderboard import TopPlayers
+
+# requests (mit urllib3 und certifi) braucht beim Import rund 70 ms; das
+# übernimmt der Worker-Thread, parallel zum ersten Frame
+requests = None
+
+# Schreibversuche pro Upload, wenn andere Kiosks dazwischen schreiben (412)
+MAX_WRITE_ATTEMPTS = 10
+
+
+class SyncError(Exception):
+    pass
+
+
+class Outbox:
+    """Noch nicht hochgeladene Ergebnisse, eine JSON-Zeile pro Ergebnis
+
+    append() schreibt sofort auf die Platte (fsync), damit ein Absturz oder
+    ein gezogener Stecker kein Ergebnis kostet. Eine beim Absturz nur halb
+    geschriebene letzte Zeile wird beim Laden verworfen.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.items = []
+        broken = False
+        try:
+            with open(path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        self.items.append(json.loads(line))
+                    except ValueError:
+                        broken = True
+        except FileNotFoundError:
+            pass
+        if broken:
+            self._rewrite()
+
+    def __len__(self):
+        return len(self.items)
+
+    def append(self, item):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(item) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        self.items.append(item)
+
+    def remove(self, count):
+        """Die ersten count Ergebnisse sind hochgeladen"""
+        self.items = self.items[count:]
+        self._rewrite()
+
+    def _rewrite(self):
+        if not self.items:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            return
+        temporary = self.path + '.tmp'
+        with open(temporary, 'w', encoding='utf-8') as f:
+            for item in self.items:
+                f.write(json.dumps(item) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, self.path)
+
+
+class ScoreSync:
+    """Ein Hintergrund-Thread für alle Zugriffe auf JSONBin
+
+    Alle Anfragen laufen über eine requests.Session (Keep-Alive statt neuer
+    Verbindung pro Tod). submit() legt ein Ergebnis in die Outbox; der
+    Worker fasst alle wartenden Ergebnisse zu einem PUT zusammen und
+    entfernt sie erst nach Erfolg. Fehlschläge werden mit exponentiell
+    wachsendem Abstand (retry_delay, verdoppelt bis max_retry_delay, mit
+    Zufallsanteil gegen gleichzeitige Kiosks) wiederholt, auch nach einem
+    Neustart. fetch() lädt den aktuellen Stand einmal; mehrere Anfragen vor
+    der Antwort ergeben ein GET.
+
+    Jeder Stand ist über sein ETag versioniert: GETs sind bedingt
+    (If-None-Match, 304 = der zwischengespeicherte Stand gilt noch), und vor
+    jedem PUT wird der neueste Stand geholt und mit den eigenen Ergebnissen
+    zusammengeführt (bester Score je Spieler), außer der bekannte Stand hat
+    schon ein ETag. Das PUT geht mit If-Match hinaus; hat ein anderer Kiosk
+    inzwischen geschrieben (412), beginnt das Ganze mit neuem Stand von
+    vorn. Liefert der Server kein ETag, bleibt es beim
+    Lesen-Zusammenführen-Schreiben ohne Konfliktprüfung.
+
+    Mit cache_path bleibt der zuletzt bestätigte Stand samt ETag und
+    Zeitpunkt auf der Platte; beim Start steht er ohne Netzwerk sofort als
+    Nachricht bereit. fetch(max_age) fragt nur, wenn dieser Stand älter als
+    max_age Sekunden ist, und auch dann bedingt.
+
+    Der Worker ändert keinen Zustand des Spiels: Ergebnisse kommen als
+    Nachrichten ('fetched' oder 'uploaded', die globalen Rankings oder
+    None), die der Hauptthread mit messages() abholt. Persönliche Rekorde
+    gehören nicht dazu; die führt jeder Kiosk lokal je Spieler.
+    """
+
+    def __init__(self, url, api_key, outbox_path, cache_path=None, rankings_size=10, session=None,
+                 retry_delay=1.0, max_retry_delay=300.0, log=print):
+        self.url = url
+        self.log = log
+        self.api_key = api_key
+        self.session = session
+        self.outbox = Outbox(outbox_path)
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.inbox = queue.SimpleQueue()
+
+        # Nur vom Worker benutzt: letzter bekannter Stand und sein ETag
+        self.rankings = TopPlayers(rankings_size)
+        self.etag = None
+        self.fetched_at = None  # time.time() des zuletzt bestätigten Stands
+        self.conflicts = 0
+        self.cache_path = cache_path
+        if cache_path:
+            self._load_cache()
+
+        self.condition = threading.Condition()
+        self.fetch_max_age = None  # Gewünschtes Laden: höchstes erlaubtes Alter des Stands
+        self.failures = 0
+        self.retry_at = 0.0
+        self.closed = False
+        # Der Worker startet erst, wenn es etwas zu tun gibt (Benchmarks und Replays nie)
+        self.thread = None
+        if self.outbox.items:
+            with self.condition:
+                self._wake()
+
+    def fetch(self, max_age=0):
+        """Stand laden lassen; ist der bekannte jünger als max_age Sekunden, ohne Anfrage"""
+        with self.condition:
+            if self.fetch_max_age is None or max_age < self.fetch_max_age:
+                self.fetch_max_age = max_age
+            self._wake()
+
+    def submit(self, entry):
+        """Ergebnis dauerhaft vormerken und hochladen, sobald es geht"""
+        with self.condition:
+            self.outbox.append({'entry': entry})
+            self._wake()
+
+    def pending(self):
+        with self.condition:
+            return len(self.outbox)
+
+    def messages(self):
+        """Nachrichten des Workers abholen (im Hauptthread, einmal pro Frame)"""
+        inbox = self.inbox
+        while not inbox.empty():
+            yield inbox.get()
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.condition.notify()
+
+    def _wake(self):
+        if self.thread is None or not self.thread.is_alive():
+            self.thread = threading.Thread(target=self._run, name='score-sync', daemon=True)
+            self.thread.start()
+        self.condition.notify()
+
+    def _run(self):
+        global requests
+        import requests
+        if self.session is None:
+            self.session = requests.Session()
+        self.session.headers['X-Master-Key'] = self.api_key
+
+        while True:
+            with self.condition:
+                while not self.closed:
+                    if self.fetch_max_age is not None:
+                        break
+                    if self.outbox.items:
+                        delay = self.retry_at - time.monotonic()
+                        if delay <= 0:
+                            break
+                        self.condition.wait(delay)
+                    else:
+                        self.condition.wait()
+                if self.closed:
+                    return
+                max_age, self.fetch_max_age = self.fetch_max_age, None
+                batch = list(self.outbox.items)
+
+            try:
+                if max_age is not None:
+                    if self.fetched_at is not None and time.time() - self.fetched_at < max_age:
+                        result = self.rankings.top()
+                    else:
+                        result = self._fetch()
+                    self.inbox.put(('fetched', result))
+                if batch and time.monotonic() >= self.retry_at:
+                    self._upload(batch)
+            except Exception as e:
+                # Unerwartete Fehler (z.B. OSError der Outbox) dürfen den Worker nicht
+                # beenden, sonst bleiben alle Ergebnisse ohne Meldung liegen
+                delay = self._back_off()
+                self.log(f"Sync-Fehler (neuer Versuch in {delay:.0f}s): {e!r}")
+                if max_age is not None:
+                    self.inbox.put(('fetched', None))
+
+    def _fetch(self):
+        """Neuesten Stand holen und einarbeiten; die Rankings oder None"""
+        headers = {'If-None-Match': self.etag} if self.etag else {}
+        try:
+            response = self.session.get(self.url, headers=headers, timeout=5)
+            if response.status_code == 304:
+                self._confirmed()
+                return self.rankings.top()
+            if response.status_code != 200:
+                raise SyncError(f"Status {response.status_code}")
+            record = response.json().get('record', {})
+        except (requests.RequestException, ValueError, SyncError) as e:
+            self.log(f"Laden fehlgeschlagen: {e}")
+            return None
+
+        # Globale Top-10 in den bekannten Stand einarbeiten (bester Score pro Spieler)
+        self.etag = response.headers.get('ETag')
+        self.rankings.merge(record.get('global_rankings', []))
+        self._confirmed()
+        rankings = self.rankings.top()
+        self.log(f"Daten geladen - Global: {len(rankings)} Einträge")
+        return rankings
+
+    def _upload(self, batch):
+        # Mit ETag ist der bekannte Stand aktuell, bis der Server 412 meldet
+        stale = self.etag is None
+        try:
+            for _ in range(MAX_WRITE_ATTEMPTS):
+                if stale and self._fetch() is None:
+                    raise SyncError("Aktueller Stand nicht verfügbar")
+                for item in batch:
+                    self.rankings.add(item['entry'])
+                rankings = self.rankings.top()
+                # Persönliche Rekorde führt jeder Kiosk lokal je Spieler (Leaderboard)
+                data = {
+                    'global_rankings': rankings,
+                    'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M')
+                }
+                headers = {'If-Match': self.etag} if self.etag else {}
+                response = self.session.put(self.url, json=data, headers=headers, timeout=10)
+                if response.status_code == 412:
+                    self.conflicts += 1
+                    stale = True
+                    continue
+                if response.status_code != 200:
+                    raise SyncError(f"Status {response.status_code}")
+                break
+            else:
+                raise SyncError(f"{MAX_WRITE_ATTEMPTS} Schreibkonflikte in Folge")
+        except (requests.RequestException, SyncError) as e:
+            delay = self._back_off()
+            self.log(f"Speichern fehlgeschlagen ({len(batch)} Ergebnisse, neuer Versuch in {delay:.0f}s): {e}")
+            return
+
+        with self.condition:
+            self.outbox.remove(len(batch))
+        self.failures = 0
+        self.etag = response.headers.get('ETag')
+        self._confirmed()
+        self.log(f"Daten gespeichert - {len(batch)} Ergebnisse, Global: {len(rankings)} Einträge")
+        self.inbox.put(('uploaded', rankings))
+
+    def _back_off(self):
+        """Nächsten Upload nach einem Fehlschlag später planen; gibt den Abstand in Sekunden zurück"""
+        self.failures += 1
+        delay = min(self.retry_delay * 2 ** (self.failures - 1), self.max_retry_delay)
+        self.retry_at = time.monotonic() + delay * random.uniform(0.5, 1.0)
+        return delay
+
+    def _load_cache(self):
+        try:
+            with open(self.cache_path, encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return
+        self.rankings.merge(cache.get('global_rankings', []))
+        self.etag = cache.get('etag')
+        self.fetched_at = cache.get('fetched_at')
+        self.inbox.put(('fetched', self.rankings.top()))
+
+    def _confirmed(self):
+        """Der bekannte Stand entspricht gerade dem Server: Zeitpunkt merken und Cache schreiben"""
+        self.fetched_at = time.time()
+        if not self.cache_path:
+            return
+        cache = {
+            'fetched_at': self.fetched_at,
+            'etag': self.etag,
+            'global_rankings': self.rankings.top(),
+        }
+        try:
+            temporary = self.cache_path + '.tmp'
+            with open(temporary, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+            os.replace(temporary, self.cache_path)
+        except OSError as e:
+            self.log(f"Cache nicht geschrieben: {e}")
@@ -0,0 +1,259 @@
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from leaderboard import TopPlayers
+from sync import ScoreSync
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """GET/PUT eines einzelnen JSONBin-Records mit ETag (Version)
+
+    GET mit passendem If-None-Match liefert 304, PUT mit veraltetem If-Match
+    412. Die ersten fail_requests Anfragen scheitern mit 503.
+    """
+
+    protocol_version = 'HTTP/1.1'
+    server_state = None  # wird von make_stand_in gesetzt
+
+    def setup(self):
+        super().setup()
+        with self.server_state['lock']:
+            self.server_state['connections'] += 1
+
+    def send_json(self, status, payload, etag=None):
+        body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+        self.send_response(status)
+        if etag:
+            self.send_header('ETag', etag)
+        if payload is not None:
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _failing(self):
+        state = self.server_state
+        state['requests'] += 1
+        if state['fail_requests'] > 0:
+            state['fail_requests'] -= 1
+            self.send_json(503, {'message': 'unavailable'})
+            return True
+        return False
+
+    def do_GET(self):
+        state = self.server_state
+        with state['lock']:
+            if self._failing():
+                return
+            etag = f'"{state["version"]}"'
+            if self.headers.get('If-None-Match') == etag:
+                state['not_modified'] += 1
+                self.send_json(304, None, etag)
+            else:
+                self.send_json(200, {'record': state['record']}, etag)
+
+    def do_PUT(self):
+        state = self.server_state
+        record = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+        with state['lock']:
+            if self._failing():
+                return
+            expected = self.headers.get('If-Match')
+            if expected and expected != f'"{state["version"]}"':
+                state['conflicts'] += 1
+                self.send_json(412, {'message': 'precondition failed'})
+                return
+            state['version'] += 1
+            state['record'] = record
+            state['puts'].append(record)
+            self.send_json(200, {'record': record}, f'"{state["version"]}"')
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_stand_in(record=None, fail_requests=0):
+    """Lokaler Ersatz für JSONBin auf einem freien Port; mit server.serve_forever() starten"""
+    state = {'record': record or {}, 'version': 1, 'lock': threading.Lock(), 'fail_requests': fail_requests,
+             'requests': 0, 'connections': 0, 'not_modified': 0, 'conflicts': 0, 'puts': []}
+    handler = type('BoundStandInHandler', (StandInHandler,), {'server_state': state})
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    server.daemon_threads = True
+    return server, state
+
+
+def start_stand_in(record=None, fail_requests=0):
+    server, state = make_stand_in(record, fail_requests)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, state, f"http://127.0.0.1:{server.server_address[1]}/v3/b/test"
+
+
+def wait_for(condition, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("Zeitüberschreitung")
+        time.sleep(0.01)
+
+
+def check_outbox():
+    """Zusammenfassen, Wiederholen und Outbox über einen Neustart hinweg"""
+    remote = {'global_rankings': [{'name': 'REMOTE', 'score': 400}]}
+    server, state, url = start_stand_in(remote, fail_requests=3)
+
+    with tempfile.TemporaryDirectory() as directory:
+        outbox_path = os.path.join(directory, 'outbox.jsonl')
+        entries = [{'name': f"SPIELER{i % 3}", 'score': 100 * i} for i in range(6)]
+
+        # Server zunächst nicht erreichbar: Ergebnisse landen nur in der Outbox
+        sync = ScoreSync(url, 'test', outbox_path, retry_delay=0.2)
+        for entry in entries[:4]:
+            sync.submit(entry)
+        wait_for(lambda: state['requests'] >= 3)
+        sync.close()
+        assert not state['puts']
+
+        # Neustart mit derselben Outbox; alles in möglichst wenigen PUTs
+        sync = ScoreSync(url, 'test', outbox_path, retry_delay=0.05)
+        assert sync.pending() == 4
+        for entry in entries[4:]:
+            sync.submit(entry)
+        wait_for(lambda: sync.pending() == 0)
+        sync.close()
+
+        kinds = [kind for kind, _ in sync.messages()]
+        assert kinds and set(kinds) == {'uploaded'}, kinds
+
+    scores = [(entry['name'], entry['score']) for entry in state['record']['global_rankings']]
+    assert scores == [('SPIELER2', 500), ('REMOTE', 400), ('SPIELER1', 400), ('SPIELER0', 300)], scores
+    # Persönliche Rekorde bleiben lokal: kein Kiosk schreibt einen für die ganze Bin
+    assert all('personal_highscore' not in put and 'player_name' not in put for put in state['puts'])
+    assert not os.path.exists(outbox_path)
+    server.shutdown()
+    print(f"Outbox: 6 Ergebnisse in {len(state['puts'])} PUTs, {state['requests']} Anfragen "
+          f"über {state['connections']} Verbindungen (3 davon absichtlich fehlgeschlagen)")
+
+
+def check_worker_errors():
+    """Ein unerwarteter Fehler (Outbox nicht schreibbar) beendet den Worker nicht"""
+    server, state, url = start_stand_in()
+    messages = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        sync = ScoreSync(url, 'test', os.path.join(directory, 'outbox.jsonl'), retry_delay=0.05,
+                         log=messages.append)
+        remove = sync.outbox.remove
+        failures = [OSError("Platte voll")]
+
+        def remove_once(count):
+            if failures:
+                raise failures.pop()
+            remove(count)
+
+        sync.outbox.remove = remove_once
+        sync.submit({'name': 'SPIELER', 'score': 100})
+        wait_for(lambda: sync.pending() == 0)
+        sync.submit({'name': 'SPIELER', 'score': 200})
+        wait_for(lambda: sync.pending() == 0)
+        sync.close()
+
+    assert any(message.startswith("Sync-Fehler") for message in messages), messages
+    assert state['record']['global_rankings'] == [{'name': 'SPIELER', 'score': 200}]
+    server.shutdown()
+    print(f"Fehler im Worker: gemeldet, {len(state['puts'])} PUTs, danach weiter hochgeladen")
+
+
+def check_concurrent_writers(kiosks=8, results=20, players=40):
+    """Viele Kiosks schreiben gleichzeitig; kein Ergebnis darf verloren gehen"""
+    server, state, url = start_stand_in()
+    rng = random.Random(0)
+    scores = rng.sample(range(100000), kiosks * results)  # Eindeutig, damit die Top 10 feststeht
+    entries = [{'name': f"SPIELER{rng.randrange(players)}", 'score': score} for score in scores]
+
+    with tempfile.TemporaryDirectory() as directory:
+        syncs = [ScoreSync(url, 'test', os.path.join(directory, f"outbox{i}.jsonl"), retry_delay=0.01,
+                           log=lambda message: None)
+                 for i in range(kiosks)]
+
+        def play(sync, own):
+            for entry in own:
+                time.sleep(random.uniform(0, 0.01))
+                sync.submit(entry)
+
+        threads = [threading.Thread(target=play, args=(sync, entries[i::kiosks])) for i, sync in enumerate(syncs)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        wait_for(lambda: all(sync.pending() == 0 for sync in syncs), timeout=60)
+
+        # Danach liest jeder Kiosk denselben Stand; unverändert kommt er als 304
+        for sync in syncs:
+            list(sync.messages())
+            sync.fetch()
+        wait_for(lambda: all(not sync.inbox.empty() for sync in syncs))
+        fetched = [dict(sync.messages())['fetched'] for sync in syncs]
+        for sync in syncs:
+            sync.close()
+
+    expected = TopPlayers(10)
+    expected.merge(entries)
+    expected = [(entry['name'], entry['score']) for entry in expected.top()]
+    final = [(entry['name'], entry['score']) for entry in state['record']['global_rankings']]
+    assert final == expected, (final, expected)
+    for rankings in fetched:
+        assert [(entry['name'], entry['score']) for entry in rankings] == expected
+    server.shutdown()
+    print(f"Gleichzeitig: {kiosks} Kiosks, {len(entries)} Ergebnisse in {len(state['puts'])} PUTs, "
+          f"{state['conflicts']} Konflikte (412) wiederholt, {state['not_modified']} GETs unverändert (304)")
+
+
+def check_cache():
+    """Start aus dem Cache ohne Anfrage; erneut gefragt wird erst nach max_age, dann bedingt"""
+    remote = {'global_rankings': [{'name': 'REMOTE', 'score': 400}], 'personal_highscore': 7}
+    server, state, url = start_stand_in(remote)
+    expected = [{'name': 'REMOTE', 'score': 400}]  # Ohne den Rekord der ganzen Bin
+
+    with tempfile.TemporaryDirectory() as directory:
+        outbox_path = os.path.join(directory, 'outbox.jsonl')
+        cache_path = os.path.join(directory, 'rankings.json')
+        sync = ScoreSync(url, 'test', outbox_path, cache_path, log=lambda message: None)
+        sync.fetch(max_age=60)
+        wait_for(lambda: not sync.inbox.empty())
+        assert list(sync.messages()) == [('fetched', expected)]
+        sync.close()
+        assert state['requests'] == 1
+
+        # Neustart: der Stand ist sofort da, innerhalb von max_age ohne Anfrage
+        sync = ScoreSync(url, 'test', outbox_path, cache_path, log=lambda message: None)
+        assert list(sync.messages()) == [('fetched', expected)]
+        sync.fetch(max_age=60)
+        wait_for(lambda: not sync.inbox.empty())
+        assert list(sync.messages()) == [('fetched', expected)]
+        assert state['requests'] == 1
+
+        # Abgelaufen: bedingtes GET, der Server antwortet 304
+        sync.fetch(max_age=0)
+        wait_for(lambda: not sync.inbox.empty())
+        assert list(sync.messages()) == [('fetched', expected)]
+        sync.close()
+    assert state['requests'] == 2 and state['not_modified'] == 1
+    server.shutdown()
+    print("Cache: Start ohne Anfrage, erneutes Laden nach Ablauf als 304")
+
+
+def run_self_check():
+    """ScoreSync gegen den lokalen Ersatz-Server"""
+    check_outbox()
+    check_cache()
+    check_worker_errors()
+    check_concurrent_writers()
+
+
+if __name__ == '__main__':
+    run_self_check()
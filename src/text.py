@@ -0,0 +1,43 @@
+from collections import OrderedDict
+
+import pygame
+
+FONT_FILE = 'freesansbold.ttf'
+
+
+class TextCache:
+    """Gerenderte Texte mit LRU-Verdrängung, Schlüssel (Schrift, Größe, Text, Farbe)
+
+    Schriften werden pro (Datei, Größe) nur einmal geladen. Texte, die sich
+    nicht ändern (Labels, Coins, Jumps, Ranglisten), kommen so jeden Frame
+    aus dem Cache; neu gerendert wird nur, wenn sich der Text ändert.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.fonts = {}
+        self.surfaces = OrderedDict()
+
+    def font(self, size, font_file=FONT_FILE):
+        font = self.fonts.get((font_file, size))
+        if font is None:
+            font = self.fonts[(font_file, size)] = pygame.font.Font(font_file, size)
+        return font
+
+    def preload(self, *sizes, font_file=FONT_FILE):
+        """Schriften beim Start laden statt beim ersten Zeichnen"""
+        for size in sizes:
+            self.font(size, font_file)
+
+    def render(self, text, size, color, font_file=FONT_FILE):
+        key = (font_file, size, text, color)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            return surface
+
+        surface = self.font(size, font_file).render(text, True, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return surface
@@ -0,0 +1,36 @@
+from game import FPS
+
+
+class FixedTimestep:
+    """Feste Simulationsschritte unabhängig von der Bildrate (Akkumulator)
+
+    advance(elapsed) sammelt die vergangene Echtzeit und gibt zurück, wie
+    viele Schritte von 1/FPS jetzt simuliert werden müssen: bei 144 Hz meist
+    keiner oder einer, bei einem langsamen Frame entsprechend mehrere. alpha
+    (0..1) ist der Anteil des nächsten Schritts, der schon vergangen ist;
+    damit wird zwischen dem vorletzten und dem letzten Zustand interpoliert.
+    Nach langen Hängern (Fenster verschoben, Laden) werden höchstens
+    max_steps nachgeholt und der Rest verworfen.
+    """
+
+    def __init__(self, step=1 / FPS, max_steps=5):
+        self.step = step
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+
+    def reset(self):
+        self.accumulator = 0.0
+
+    def advance(self, elapsed):
+        self.accumulator += elapsed
+        steps = int(self.accumulator / self.step)
+        if steps > self.max_steps:
+            steps = self.max_steps
+            self.accumulator %= self.step
+        else:
+            self.accumulator -= steps * self.step
+        return steps
+
+    @property
+    def alpha(self):
+        return min(self.accumulator / self.step, 1.0)
@@ -0,0 +1,145 @@
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import time
+
+from bots import POLICIES
+from game import Game, FPS, enable_headless
+from stats import percentile
+
+# Abbruch nach 30 Minuten Spielzeit, damit perfekte Bots nicht ewig laufen
+MAX_FRAMES = 30 * 60 * FPS
+
+# Eine headless Game-Instanz pro Worker-Prozess
+_worker_game = None
+
+
+def _init_worker():
+    """Worker vorbereiten: SDL ohne Fenster, ein Game für alle Runden"""
+    global _worker_game
+    enable_headless()
+    _worker_game = Game()
+
+
+def play_game(policy_name, seed, max_frames=MAX_FRAMES):
+    """Spielt eine Runde mit festem Seed und liefert das Ergebnis als Dictionary"""
+    game = _worker_game or Game()
+    policy = POLICIES[policy_name]
+
+    random.seed(seed)  # Zufall der Bots (z.B. random_jumper)
+    game.reset(seed)
+    state = game.state()
+    while not game.game_over and game.frame < max_frames:
+        state = game.step(policy(state))
+
+    if not game.game_over:
+        game.die('timeout')
+
+    return {
+        'policy': policy_name,
+        'seed': seed,
+        'coins': game.coins_collected,
+        'timer': round(game.timer, 2),
+        'jumps': game.jumps,
+        'score': game.score,
+        'death_cause': game.death_cause,
+    }
+
+
+def _play_task(task):
+    return play_game(*task)
+
+
+def aggregate(results):
+    """Mittelwert und Perzentile der Scores je Bot"""
+    by_policy = {}
+    for result in results:
+        by_policy.setdefault(result['policy'], []).append(result)
+
+    summary = {}
+    for policy_name, games in by_policy.items():
+        scores = sorted(game['score'] for game in games)
+        causes = {}
+        for game in games:
+            causes[game['death_cause']] = causes.get(game['death_cause'], 0) + 1
+        summary[policy_name] = {
+            'games': len(games),
+            'mean': sum(scores) / len(scores),
+            'p10': percentile(scores, 10),
+            'p50': percentile(scores, 50),
+            'p90': percentile(scores, 90),
+            'p99': percentile(scores, 99),
+            'max': scores[-1],
+            'mean_coins': sum(game['coins'] for game in games) / len(games),
+            'mean_timer': sum(game['timer'] for game in games) / len(games),
+            'mean_jumps': sum(game['jumps'] for game in games) / len(games),
+            'death_causes': causes,
+        }
+    return summary
+
+
+def run_tournament(policy_names, games_per_policy, base_seed=0, workers=None, max_frames=MAX_FRAMES,
+                   on_result=None):
+    """Verteilt alle Runden auf einen Prozesspool und sammelt die Ergebnisse
+
+    Jeder Bot spielt dieselben Seeds (base_seed, base_seed + 1, ...), damit
+    die Bots auf identischen Spike-Folgen verglichen werden. Ergebnisse
+    kommen in Fertigstellungsreihenfolge an und werden an on_result
+    weitergereicht; zurückgegeben werden sie nach (Bot, Seed) sortiert.
+    """
+    tasks = [(policy_name, base_seed + i, max_frames)
+             for policy_name in policy_names
+             for i in range(games_per_policy)]
+
+    workers = workers or os.cpu_count()
+    chunksize = max(1, len(tasks) // (workers * 8))
+
+    results = []
+    with multiprocessing.Pool(workers, initializer=_init_worker) as pool:
+        for result in pool.imap_unordered(_play_task, tasks, chunksize=chunksize):
+            results.append(result)
+            if on_result:
+                on_result(result)
+
+    results.sort(key=lambda result: (policy_names.index(result['policy']), result['seed']))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Turnier: Bots spielen headless gegeneinander")
+    parser.add_argument('policies', nargs='*', default=list(POLICIES),
+                        help=f"Bots (Standard: alle): {', '.join(POLICIES)}")
+    parser.add_argument('-n', '--games', type=int, default=100, help="Runden pro Bot")
+    parser.add_argument('-s', '--seed', type=int, default=0, help="Seed der ersten Runde")
+    parser.add_argument('-w', '--workers', type=int, default=None, help="Prozesse (Standard: alle Kerne)")
+    parser.add_argument('--max-frames', type=int, default=MAX_FRAMES, help="Abbruch pro Runde")
+    parser.add_argument('--stream', action='store_true', help="Jedes Ergebnis sofort als JSON-Zeile ausgeben")
+    parser.add_argument('--output', help="Alle Ergebnisse und die Auswertung als JSON speichern")
+    args = parser.parse_args()
+    for policy_name in args.policies:
+        if policy_name not in POLICIES:
+            parser.error(f"unbekannter Bot: {policy_name}")
+
+    enable_headless()
+    on_result = (lambda result: print(json.dumps(result), flush=True)) if args.stream else None
+
+    start = time.perf_counter()
+    results = run_tournament(args.policies, args.games, args.seed, args.workers, args.max_frames, on_result)
+    elapsed = time.perf_counter() - start
+    summary = aggregate(results)
+
+    print(f"{len(results)} Runden in {elapsed:.2f}s")
+    for policy_name, stats in summary.items():
+        print(f"{policy_name:>14}: mean {stats['mean']:.1f}  p50 {stats['p50']}  p90 {stats['p90']}  "
+              f"p99 {stats['p99']}  max {stats['max']}  coins {stats['mean_coins']:.1f}  "
+              f"jumps {stats['mean_jumps']:.1f}  {stats['death_causes']}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'summary': summary, 'results': results}, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,222 @@
+import copy
+import random
+import sys
+import time
+
+from game import Game, FRAME_SPEEDUP, JUMP_SPEEDUP, enable_headless
+
+# Physik-Modi wie Game.modified_physics_type ('normal' = ohne Uhr-Effekt)
+MODES = ('normal', 'slow', 'fast')
+
+
+class JumpTable:
+    """Flugbahnen aller Sprünge als Tabellen, einmal aus der Spielphysik erzeugt
+
+    Für jeden Physik-Modus und beide Startseiten (Boden, Decke) steht die
+    y-Position der Spielfigur nach jedem Schritt bis zur Landung in flights,
+    für jeden möglichen Richtungswechsel in der Luft die Bahn danach in
+    reversals. Erzeugt werden die Tabellen von Game.handle_jump_input und
+    Game.update_player_movement selbst, die Werte sind also bitgleich mit
+    dem Spiel. clears() beantwortet damit "überwindet ein Sprung in delay
+    Frames diese Spikes?", ohne ein Game zu kopieren und Schritt für Schritt
+    zu simulieren.
+
+    Annahmen: der Modus bleibt während des Flugs gleich (keine Uhr
+    eingesammelt oder abgelaufen) und game_speed wächst nur durch Frames und
+    Sprünge (keine Münze). Neu spawnende Spikes kommen nicht vor.
+    """
+
+    def __init__(self, sizes=None):
+        scratch = Game(sizes, seed=0)
+        self.ground_y = scratch.ground_y
+        self.ceiling_y = scratch.ceiling_y
+        self.player_x = scratch.player_pos[0]
+
+        # Spike-Hitboxen wie EntityTable.hits (beide Spike-Arten gleich groß)
+        kind = scratch.entities.kinds[scratch.spike_kind]
+        offset_x, self.player_dy, width, self.player_height = kind.player_box
+        self.player_left = int(self.player_x + offset_x)
+        self.player_right = self.player_left + width
+        self.spike_dx, self.spike_dy, self.spike_width, self.spike_height = kind.box
+
+        # Modus -> Startseite -> Bahn; reversals[...][k]: Richtungswechsel nach k Flugschritten
+        self.flights = {}
+        self.reversals = {}
+        for mode in MODES:
+            self.flights[mode] = {}
+            self.reversals[mode] = {}
+            for start_y in (self.ground_y, self.ceiling_y):
+                flight = self._fly(scratch, mode, start_y)
+                self.flights[mode][start_y] = flight
+                self.reversals[mode][start_y] = [None] + [
+                    self._fly(scratch, mode, start_y, reverse_after) for reverse_after in range(1, len(flight))
+                ]
+
+    @staticmethod
+    def _fly(game, mode, start_y, reverse_after=None):
+        """Sprung von start_y im Spiel nachstellen; y nach jedem Schritt (ab dem Wechsel, falls gewünscht)"""
+        game.reset(0)
+        game.player_pos[1] = start_y
+        if mode != 'normal':
+            game.apply_clock_physics(mode)
+        game.handle_jump_input()
+        path = []
+        while game.is_moving_up or game.is_moving_down:
+            if len(path) == reverse_after:
+                game.handle_jump_input()
+                path = []
+                reverse_after = None
+            game.update_player_movement()
+            path.append(game.player_pos[1])
+        return tuple(path)
+
+    def frames_to_land(self, mode, start_y, reverse_after=None):
+        """Schritte vom Sprung bis zur Landung"""
+        if reverse_after is None:
+            return len(self.flights[mode][start_y])
+        return reverse_after + len(self.reversals[mode][start_y][reverse_after])
+
+    def path(self, mode, start_y, delay=0, reverse_after=None, rest=0):
+        """Bahn eines Sprungs als (y nach jedem Schritt, Schritte mit Tastendruck)
+
+        Die Spielfigur wartet delay Frames auf start_y, springt (optional mit
+        Richtungswechsel nach reverse_after Flugschritten) und steht danach
+        noch rest Frames am Landepunkt.
+        """
+        flight = self.flights[mode][start_y]
+        if reverse_after is None:
+            ys = (start_y,) * delay + flight
+            presses = (delay,)
+        else:
+            if not 0 < reverse_after < len(flight):
+                raise ValueError(f"Richtungswechsel nach {reverse_after} Schritten nicht möglich")
+            ys = (start_y,) * delay + flight[:reverse_after] + self.reversals[mode][start_y][reverse_after]
+            presses = (delay, delay + reverse_after)
+        return ys + (ys[-1],) * rest, presses
+
+    def first_hit(self, ys, presses, spikes, game_speed):
+        """Erster Schritt, in dem die Spielfigur auf der Bahn ys einen Spike berührt, sonst None
+
+        spikes sind die Positionen vor dem ersten Schritt (Game.state()['spikes']),
+        game_speed der aktuelle Wert. Die Spikes werden mit denselben
+        Subtraktionen bewegt wie in EntityTable.move.
+        """
+        xs = [x for x, _ in spikes]
+        tops = [int(y + self.spike_dy) for _, y in spikes]
+        left, right = self.player_left, self.player_right
+        spike_dx, spike_width, spike_height = self.spike_dx, self.spike_width, self.spike_height
+        player_dy, player_height = self.player_dy, self.player_height
+        speed = game_speed
+        for step, y in enumerate(ys):
+            if step in presses:
+                speed += JUMP_SPEEDUP
+            top = int(y + player_dy)
+            bottom = top + player_height
+            for i, x in enumerate(xs):
+                x -= speed
+                xs[i] = x
+                spike_left = int(x + spike_dx)
+                if spike_left < right and spike_left + spike_width > left:
+                    spike_top = tops[i]
+                    if spike_top < bottom and spike_top + spike_height > top:
+                        return step
+            speed += FRAME_SPEEDUP
+        return None
+
+    def clears(self, spikes, game_speed, mode='normal', start_y=None, delay=0, reverse_after=None, rest=0):
+        """True, wenn ein Sprung in delay Frames (von Boden oder Decke) keinen der Spikes berührt"""
+        if start_y is None:
+            start_y = self.ground_y
+        ys, presses = self.path(mode, start_y, delay, reverse_after, rest)
+        return self.first_hit(ys, presses, spikes, game_speed) is None
+
+    def safe_delays(self, spikes, game_speed, mode='normal', start_y=None, max_delay=30, rest=0):
+        """Alle Wartezeiten 0..max_delay, nach denen ein Sprung die Spikes überwindet"""
+        return [delay for delay in range(max_delay + 1)
+                if self.clears(spikes, game_speed, mode, start_y, delay, rest=rest)]
+
+
+def full_loop_clears(game, delay=0, reverse_after=None, rest=0):
+    """Referenz: dieselbe Frage durch Kopieren und Simulieren des ganzen Spiels"""
+    game = copy.deepcopy(game)
+    frames = delay + 1
+    pressed = {delay}
+    if reverse_after is not None:
+        pressed.add(delay + reverse_after)
+    step = 0
+    while step < frames or game.is_moving_up or game.is_moving_down:
+        game.step(step in pressed)
+        if game.game_over:
+            return False
+        step += 1
+    for _ in range(rest):
+        game.step(False)
+        if game.game_over:
+            return False
+    return True
+
+
+def prepare_situation(game, mode):
+    """Münzen und Uhren entfernen, keine neuen spawnen und den Modus dauerhaft setzen (Annahmen von JumpTable)"""
+    entities = game.entities
+    for i in range(entities.start, entities.end):
+        if entities.alive[i] and entities.kind[i] not in game.spike_kinds:
+            entities.remove(i)
+    game.spawn_timer_spike = game.spawn_timer_coin = game.spawn_timer_uhr = game.spawn_timer_uhr2 = -10 ** 6
+    game.clock_active = game.clock2_active = False
+    game.reset_physics()
+    if mode == 'slow':
+        game.clock_active, game.clock_timer = True, float('inf')
+    elif mode == 'fast':
+        game.clock2_active, game.clock2_timer = True, float('inf')
+    if mode != 'normal':
+        game.apply_clock_physics(mode)
+
+
+def run_self_check(situations=300, seed=0):
+    """Tabellen gegen das Spiel prüfen und die Abfrage gegen Kopieren + Simulieren messen"""
+    table = JumpTable()
+    for mode in MODES:
+        for start_y, side in ((table.ground_y, "Boden"), (table.ceiling_y, "Decke")):
+            print(f"{mode:>6} ab {side}: {table.frames_to_land(mode, start_y)} Frames bis zur Landung")
+
+    # Zufällige Situationen mit Spikes vor der Spielfigur: Tabelle und volles Spiel müssen übereinstimmen
+    rng = random.Random(seed)
+    game = Game(seed=seed)
+    checked = cleared = 0
+    table_seconds = loop_seconds = 0.0
+    while checked < situations:
+        game.step(rng.random() < 0.05)
+        if game.game_over:
+            game.reset(rng.randrange(2 ** 32))
+            continue
+        if game.is_moving_up or game.is_moving_down or not game.entities.count(game.spike_kind):
+            continue
+        situation = copy.deepcopy(game)
+        mode = MODES[checked % len(MODES)]
+        prepare_situation(situation, mode)
+        start_y = situation.player_pos[1]
+        spikes = situation.entities.positions(situation.spike_kinds)
+        delay = rng.randrange(20)
+        flight = table.frames_to_land(mode, start_y)
+        reverse_after = rng.randrange(1, flight) if rng.random() < 0.3 else None
+
+        start = time.perf_counter()
+        expected = full_loop_clears(situation, delay, reverse_after, rest=5)
+        loop_seconds += time.perf_counter() - start
+        start = time.perf_counter()
+        result = table.clears(spikes, situation.game_speed, mode, start_y, delay, reverse_after, rest=5)
+        table_seconds += time.perf_counter() - start
+
+        assert result == expected, (mode, start_y, spikes, situation.game_speed, delay, reverse_after)
+        checked += 1
+        cleared += result
+
+    print(f"{checked} Situationen wie im Spiel ({cleared} überwunden)")
+    print(f"Abfrage: {table_seconds / checked * 1e6:.1f} µs, Kopieren + Simulieren: "
+          f"{loop_seconds / checked * 1e6:.1f} µs")
+
+
+if __name__ == '__main__':
+    enable_headless()
+    run_self_check(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
@@ -0,0 +1,210 @@
+import argparse
+import json
+import multiprocessing
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from bots import spike_dodger
+from game import Game, FPS, calculate_score, enable_headless
+from replay import Replay, simulate
+
+# Längere Runden werden nicht nachgerechnet (Schutz vor endlosen Replays)
+MAX_FRAMES = 60 * 60 * FPS
+MAX_BODY_SIZE = 1024 * 1024
+MAX_BATCH_SIZE = 100  # Einreichungen pro POST /verify/batch
+
+# Eine headless Game-Instanz pro Worker-Prozess
+_worker_game = None
+
+
+def _init_worker():
+    """Worker vorbereiten: SDL ohne Fenster, ein Game für alle Prüfungen"""
+    global _worker_game
+    enable_headless()
+    _worker_game = Game()
+
+
+def verify_submission(submission):
+    """Rechnet ein eingereichtes Replay nach und vergleicht es mit den gemeldeten Werten
+
+    submission: {'replay': Base64-Replay, 'score': int, optional 'coins', 'time', 'jumps'}
+    """
+    try:
+        replay = Replay.from_text(submission['replay'])
+        claimed_score = int(submission['score'])
+    except (KeyError, TypeError, ValueError) as e:
+        return {'accepted': False, 'reason': f"Ungültige Einreichung: {e}"}
+
+    game = simulate(replay, MAX_FRAMES, _worker_game)
+    result = {
+        'accepted': False,
+        'seed': replay.seed,
+        'score': calculate_score(game.coins_collected, game.timer, game.jumps),
+        'coins': game.coins_collected,
+        'time': round(game.timer, 1),
+        'jumps': game.jumps,
+        'frames': game.frame,
+    }
+
+    if not game.game_over:
+        result['reason'] = "Replay endet nicht mit dem Tod der Spielfigur"
+    elif result['score'] != claimed_score:
+        result['reason'] = f"Score stimmt nicht (gemeldet {claimed_score}, nachgerechnet {result['score']})"
+    elif any(key in submission and submission[key] != result[key] for key in ('coins', 'time', 'jumps')):
+        result['reason'] = "Coins, Zeit oder Sprünge stimmen nicht"
+    else:
+        result['accepted'] = True
+    return result
+
+
+class VerifyHandler(BaseHTTPRequestHandler):
+    """POST /verify (ein Objekt) und POST /verify/batch (Liste), GET /health"""
+
+    protocol_version = 'HTTP/1.1'
+    pool = None  # wird von make_server gesetzt
+
+    def send_json(self, status, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == '/health':
+            self.send_json(200, {'status': 'ok'})
+        else:
+            self.send_json(404, {'error': 'not found'})
+
+    def reject(self, status, error):
+        """Fehler melden und die Verbindung schließen (ein ungelesener Body würde die nächste Anfrage stören)"""
+        self.close_connection = True
+        self.send_json(status, {'error': error})
+
+    def do_POST(self):
+        try:
+            length = int(self.headers['Content-Length'])
+            if length < 0:
+                raise ValueError(length)
+        except (TypeError, ValueError):
+            self.reject(400, 'missing or invalid Content-Length')
+            return
+        if length > MAX_BODY_SIZE:
+            self.reject(413, 'request too large')
+            return
+        try:
+            payload = json.loads(self.rfile.read(length))
+        except ValueError:
+            self.send_json(400, {'error': 'invalid json'})
+            return
+
+        if self.path == '/verify' and isinstance(payload, dict):
+            self.send_json(200, self.pool.apply(verify_submission, (payload,)))
+        elif self.path == '/verify/batch' and isinstance(payload, list):
+            if len(payload) > MAX_BATCH_SIZE:
+                self.send_json(413, {'error': f'at most {MAX_BATCH_SIZE} submissions per batch'})
+                return
+            self.send_json(200, self.pool.map(verify_submission, payload))
+        else:
+            self.send_json(400, {'error': 'expected POST /verify {...} or /verify/batch [...]'})
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_server(host='127.0.0.1', port=8765, workers=None):
+    """HTTP-Server plus Prozesspool; mit server.serve_forever() starten"""
+    pool = multiprocessing.Pool(workers, initializer=_init_worker)
+    handler = type('BoundVerifyHandler', (VerifyHandler,), {'pool': pool})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server, pool
+
+
+def make_submissions(count, base_seed=0, tamper_every=10):
+    """Echte Runden mit spike_dodger spielen; jede n-te Einreichung wird geschönt"""
+    game = Game()
+    submissions = []
+    for i in range(count):
+        game.reset(base_seed + i)
+        state = game.state()
+        while not game.game_over:
+            state = game.step(spike_dodger(state))
+        submission = {
+            'replay': Replay.from_game(game).to_text(),
+            'score': game.score,
+            'coins': game.coins_collected,
+            'time': round(game.timer, 1),
+            'jumps': game.jumps,
+        }
+        if tamper_every and i % tamper_every == 0:
+            submission['score'] += 100
+        submissions.append(submission)
+    return submissions
+
+
+def run_load_benchmark(count, concurrency, workers):
+    """Startet den Server lokal und schickt count Einreichungen parallel"""
+    submissions = make_submissions(count)
+    server, pool = make_server(port=0, workers=workers)
+    url = f"http://127.0.0.1:{server.server_address[1]}/verify"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    def submit(submission):
+        request = urllib.request.Request(url, json.dumps(submission).encode('utf-8'),
+                                         {'Content-Type': 'application/json'})
+        start = time.perf_counter()
+        with urllib.request.urlopen(request, timeout=30) as response:
+            result = json.loads(response.read())
+        return result, time.perf_counter() - start
+
+    try:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(concurrency) as executor:
+            responses = list(executor.map(submit, submissions))
+        elapsed = time.perf_counter() - start
+    finally:
+        server.shutdown()
+        pool.terminate()
+
+    latencies = sorted(latency for _, latency in responses)
+    accepted = sum(result['accepted'] for result, _ in responses)
+    print(f"{count} Einreichungen in {elapsed:.2f}s = {count / elapsed:.0f}/s "
+          f"({concurrency} gleichzeitig, {workers or multiprocessing.cpu_count()} Worker)")
+    print(f"Latenz p50 {latencies[len(latencies) // 2] * 1000:.1f} ms, "
+          f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.1f} ms")
+    print(f"Akzeptiert {accepted}, abgelehnt {count - accepted}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prüft eingereichte Scores per Replay-Nachrechnung")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('-w', '--workers', type=int, default=None, help="Prozesse (Standard: alle Kerne)")
+    parser.add_argument('--bench', type=int, metavar='N', help="Lastbenchmark mit N Einreichungen statt Server")
+    parser.add_argument('--concurrency', type=int, default=16, help="Gleichzeitige Anfragen im Benchmark")
+    args = parser.parse_args()
+
+    enable_headless()
+    if args.bench:
+        run_load_benchmark(args.bench, args.concurrency, args.workers)
+        return
+
+    server, pool = make_server(args.host, args.port, args.workers)
+    print(f"Verifikation läuft auf http://{args.host}:{args.port}/verify")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        pool.terminate()
+
+
+if __name__ == '__main__':
+    main()